@@ -9,7 +9,7 @@ The assistant bot supports the following commands:
 - 'phone': Display a contact's phone number.
 - 'all': Display all contacts.
 
-Imports:
+Imports (loaded lazily on first attribute access, see PEP 562):
 - `handlers` from `.cli`: Contains functions to handle various contact management commands.
 - `AddressBook` from `.models`: Represents a collection of contact records.
 - `parse_input` from `.cli.parse_input`: Parses user input into commands and arguments.
@@ -31,6 +31,35 @@ Main Function:
 - main: Initializes the AddressBook and enters an infinite loop to handle user commands
   until 'close' or 'exit' is entered.
 """
-from .cli import handlers
-from .models import AddressBook
-from .cli.parse_input import parse_input
+import importlib
+
+__all__ = ["handlers", "AddressBook", "parse_input"]
+
+# Public name -> (module to import, attribute of that module or None for the module itself)
+_LAZY_ATTRIBUTES = {
+    "handlers": ("bot.cli.handlers", None),
+    "AddressBook": ("bot.models", "AddressBook"),
+    "parse_input": ("bot.cli.parse_input", "parse_input"),
+}
+
+def __getattr__(name: str):
+    """
+    Imports the requested public attribute on first access and caches it in the module.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The imported module or object.
+
+    Raises:
+        AttributeError: If the name is not a public attribute of the package.
+    """
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
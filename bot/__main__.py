@@ -0,0 +1,214 @@
+"""
+This module provides the main function to run an assistant bot for managing contacts.
+
+The assistant bot supports the following commands:
+- 'close' or 'exit': Exit the program.
+- 'hello': Greet the user.
+- 'add-contact': Add a new contact.
+- 'change-contact': Update an existing contact.
+- 'delete-contact': Remove a contact.
+- 'all-contacts': Display all contacts.
+- 'search-contact': Search for contacts.
+- 'show-phones': Display a contact's phone numbers.
+- 'show-birthday': Show a contact's birthday.
+- 'birthdays': List upcoming birthdays.
+- 'add-note': Add a new note.
+- 'change-note': Update an existing note.
+- 'delete-note': Remove a note.
+- 'all-notes': Display all notes.
+- 'search-note': Search for notes.
+- 'add-note-tag': Add a tag to a note.
+- 'delete-note-tag': Remove a tag from a note.
+- 'help': Display all available commands.
+
+Imports:
+- List from typing: Used for type annotations.
+- handlers from bot.cli: Contains functions to handle various contact management commands.
+- AddressBook from bot.models: Represents a collection of contact records.
+- parse_input from bot.cli.parse_input: Parses user input into commands and arguments.
+
+Functions:
+- main: The entry point of the assistant bot, which continuously prompts the user
+for commands and processes them accordingly.
+
+Usage:
+- Run the package with `python -m bot` or the `run-bot` command to start the assistant bot.
+- The bot will prompt the user for commands and manage the contact records in the AddressBook.
+
+Example:
+    Run the package:
+        $ python -m bot
+    or the installed command:
+        $ run-bot
+    Interact with the bot using the supported commands.
+
+Main Function:
+- main: Initializes the AddressBook and enters an infinite loop to handle user commands
+until 'close' or 'exit' is entered.
+
+if __name__ == "__main__":
+    main()
+
+The above block ensures that the main function runs only when the module is executed
+as a script, not when it is imported as a module.
+"""
+
+from importlib.resources import files
+from typing import List
+
+from prompt_toolkit import prompt
+from prompt_toolkit.shortcuts import CompleteStyle
+
+from bot.cli import handlers
+from bot.cli.data_manager import load_data, save_data
+from bot.cli.parse_input import parse_input
+from bot.cli.commands_completer import completer, load_history
+from bot.cli import note_handlers
+from bot.cli.note_data_manager import load_data as note_load_data, save_data as note_save_data
+
+from bot.utils import print_with_newlines
+
+# The logo never changes, so it is read once at import from the package resources
+_LOGO = files("bot").joinpath("logo.txt").read_text()
+
+#------------------------------------------------------------------
+# Command group: Contact Management
+#------------------------------------------------------------------
+
+# Command -> (handler taking the arguments and the address book, use_rich_print)
+_CONTACT_COMMANDS = {
+    "add-contact": (handlers.add_contact, True),
+    "change-contact": (handlers.change_contact, True),
+    "delete-contact": (handlers.delete_contact, True),
+    "all-contacts": (lambda args, book: handlers.show_all(book), False),
+    "search-contact": (handlers.search_contact, True),
+    "show-phones": (handlers.show_phones, True),
+    "show-birthday": (handlers.show_birthday, True),
+    "birthdays": (handlers.birthdays, False),
+}
+
+#------------------------------------------------------------------
+# Command group: Note Management
+#------------------------------------------------------------------
+
+# Command -> (handler taking the arguments and the notebook, use_rich_print)
+_NOTE_COMMANDS = {
+    "add-note": (note_handlers.add_note, True),
+    "change-note": (note_handlers.change_note, True),
+    "delete-note": (note_handlers.delete_note, True),
+    "all-notes": (lambda args, notes: note_handlers.show_all_notes(notes), False),
+    "search-note": (note_handlers.search_note, False),
+    "add-note-tag": (note_handlers.add_note_tag, True),
+    "delete-note-tag": (note_handlers.delete_note_tag, True),
+}
+
+# Commands handled directly in the main loop
+_CORE_COMMANDS = frozenset({"close", "exit", "help", "hello"})
+
+# Checked once at import, so a command listed by help without a handler (or the
+# reverse) is caught before a session can lose unsaved changes to it
+_UNMATCHED_COMMANDS = handlers._COMMANDS_SET.symmetric_difference(
+    _CORE_COMMANDS.union(_CONTACT_COMMANDS, _NOTE_COMMANDS)
+)
+if _UNMATCHED_COMMANDS:
+    raise RuntimeError(
+        f"Commands without both a help entry and a handler: {', '.join(sorted(_UNMATCHED_COMMANDS))}"
+    )
+
+def main() -> None:
+    """
+    Runs the assistant bot for managing contacts.
+
+    The function continuously prompts the user for commands and processes them accordingly:
+    - 'close' or 'exit' to exit the program
+    - 'hello' to greet the user
+    - 'add-contact' to add a contact
+    - 'change-contact' to update a contact
+    - 'delete-contact' to remove a contact
+    - 'all-contacts' to display all contacts
+    - 'search-contact' to search for contacts
+    - 'show-phones' to display a contact's phone numbers
+    - 'show-birthday' to show a contact's birthday
+    - 'birthdays' to list upcoming birthdays
+    - 'add-note' to add a note
+    - 'change-note' to update a note
+    - 'delete-note' to remove a note
+    - 'all-notes' to display all notes
+    - 'search-note' to search for notes
+    - 'add-note-tag' to add a tag to a note
+    - 'delete-note-tag' to remove a tag from a note
+    - 'help' to display available commands
+
+    Uses handlers from the 'handlers' module for contact and note management.
+
+    Returns:
+    None
+    """
+    address_book = load_data()
+    note_list = note_load_data()
+
+    print_with_newlines(f"[blue]{_LOGO}")
+    print_with_newlines("Welcome to the assistant bot!")
+    print_with_newlines("Type 'help' to see a list of available commands.", lines_before=0)
+
+    history = load_history()
+    # The command list and help text are fixed, so they are fetched once for the whole session
+    _, commands_str, known_commands = handlers.show_help()
+
+    while True:
+        user_input: str = prompt(
+            "Enter a command: ",
+            completer=completer,
+            complete_style=CompleteStyle.COLUMN,
+            history=history
+        )
+
+        if not user_input:
+            continue
+
+        command: str
+        args: List[str]
+        command, *args = parse_input(user_input)
+
+        if command not in known_commands:
+            print_with_newlines("Invalid command.")
+            continue
+
+        #------------------------------------------------------------------
+        # Command group: Core Commands
+        #------------------------------------------------------------------
+
+        if command in ["close", "exit"]:
+            save_data(address_book)
+            note_save_data(note_list)
+            print_with_newlines("Good bye!")
+            break
+
+        if command == "help":
+            print_with_newlines(commands_str)
+            continue
+
+        if command == "hello":
+            print_with_newlines("How can I help you?")
+            continue
+
+        #------------------------------------------------------------------
+        # Command groups: Contact and Note Management
+        #------------------------------------------------------------------
+
+        contact_entry = _CONTACT_COMMANDS.get(command)
+        if contact_entry is not None:
+            handler, use_rich_print = contact_entry
+            print_with_newlines(handler(args, address_book), use_rich_print=use_rich_print)
+            continue
+
+        note_entry = _NOTE_COMMANDS.get(command)
+        if note_entry is not None:
+            handler, use_rich_print = note_entry
+            print_with_newlines(handler(args, note_list), use_rich_print=use_rich_print)
+            continue
+
+        print_with_newlines("Invalid command.")
+
+if __name__ == "__main__":
+    main()
@@ -24,8 +24,49 @@ Example:
 
 Usage:
     Import the necessary functions into your script to handle user commands for managing contacts.
+
+The handler and data manager functions pull in Rich, pickle and the models package,
+so they are imported lazily on first attribute access (see PEP 562).
 """
-from .handlers import show_help, add_contact, change_contact, show_phones, show_all, search_contact
+import importlib
+
 from .input_error import input_error
 from .parse_input import parse_input
-from .data_manager import save_data, load_data
+
+__all__ = [
+    "show_help", "add_contact", "change_contact", "show_phones", "show_all", "search_contact",
+    "input_error", "parse_input", "save_data", "load_data",
+]
+
+# Public name -> module that defines it
+_LAZY_ATTRIBUTES = {
+    "show_help": "bot.cli.handlers",
+    "add_contact": "bot.cli.handlers",
+    "change_contact": "bot.cli.handlers",
+    "show_phones": "bot.cli.handlers",
+    "show_all": "bot.cli.handlers",
+    "search_contact": "bot.cli.handlers",
+    "save_data": "bot.cli.data_manager",
+    "load_data": "bot.cli.data_manager",
+}
+
+def __getattr__(name: str):
+    """
+    Imports the requested public function on first access and caches it in the module.
+
+    Args:
+        name (str): The attribute name.
+
+    Returns:
+        Any: The imported function.
+
+    Raises:
+        AttributeError: If the name is not a public attribute of the package.
+    """
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
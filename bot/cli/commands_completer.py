@@ -7,25 +7,103 @@ Classes:
 
 Functions:
 - show_help: Retrieves the list of available commands and their descriptions.
+- refresh_commands: Rebuilds the cached command trie from `show_help`.
+- load_history: Creates the file-backed command history used by the prompt.
 
 Usage:
 - The CommandCompleter class is used to provide suggestions for the available
   commands in the bot's CLI as the user types.
 """
 
+import sys
+
 from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.history import FileHistory
 
 from bot.cli.handlers import show_help
 
+# Minimum number of typed characters before any completions are offered. With an
+# empty prompt every command would match, so nothing is suggested until typing starts.
+MIN_COMPLETION_PREFIX = 1
+
+# Key under which every trie node stores the completions passing through it
+_MATCHES = ""
+
+def _build_command_trie() -> dict:
+    """
+    Builds a prefix trie over the completion texts of all available commands.
+
+    Each node is a dict mapping the next (lowercased) character to a child node.
+    The special `_MATCHES` key holds, in `show_help` order, every completion text
+    that passes through the node, so a lookup never has to walk the subtree.
+    Commands are case-insensitive, so the trie is keyed on the lowercased text.
+
+    Returns:
+        dict: The root node of the trie.
+    """
+    commands, _, _ = show_help()
+    root = {_MATCHES: []}
+    for command in commands:
+        completion_text = sys.intern(command.split(':', maxsplit=1)[0])
+        node = root
+        node[_MATCHES].append(completion_text)
+        for char in completion_text.lower():
+            node = node.setdefault(char, {_MATCHES: []})
+            node[_MATCHES].append(completion_text)
+    return root
+
+# Commands are static, so the trie is built once instead of on every keystroke
+_COMMAND_TRIE = _build_command_trie()
+
+# Upper bound on the number of distinct prefixes a CommandCompleter remembers
+_PREFIX_CACHE_SIZE = 256
+
+def refresh_commands() -> None:
+    """
+    Rebuilds the cached command trie.
+
+    Call this if the list of commands returned by `show_help` changes at runtime.
+    """
+    global _COMMAND_TRIE
+    _COMMAND_TRIE = _build_command_trie()
+
+def _find_completions(prefix: str) -> list:
+    """
+    Returns the completion texts of all commands starting with the given prefix.
+
+    Args:
+        prefix (str): The text typed so far, already lowercased.
+
+    Returns:
+        list: The matching completion texts, or an empty list if there are none.
+    """
+    node = _COMMAND_TRIE
+    for char in prefix:
+        node = node.get(char)
+        if node is None:
+            return []
+    return node[_MATCHES]
+
 class CommandCompleter(Completer):
     """
     A custom completer for command-line input, providing auto-completion
     suggestions only for the first word (the command).
 
+    Attributes:
+        _prefix_cache (dict): The completions already computed for each typed prefix.
+        _cached_trie (dict): The command trie the cached completions were computed from.
+
     Methods:
         get_completions: Yields possible completions for the input text if it matches
         available commands and is the first word in the input.
     """
+    def __init__(self) -> None:
+        """
+        Initializes the completer with an empty per-prefix result cache.
+        """
+        self._prefix_cache = {}
+        self._cached_trie = _COMMAND_TRIE
+
     def get_completions(self, document, complete_event):
         """
         Generates command completions based on the text before the cursor.
@@ -40,27 +118,55 @@ class CommandCompleter(Completer):
         # Get the current input text before the cursor
         text_before_cursor = document.text_before_cursor.strip()
 
+        # Don't offer completions until enough of the command has been typed
+        if len(text_before_cursor) < MIN_COMPLETION_PREFIX:
+            return
+
+        # The trie root doubles as a first-character index: bail out before any other
+        # work when no command starts with the typed character
+        if text_before_cursor and text_before_cursor[0].lower() not in _COMMAND_TRIE:
+            return
+
         # If more than one word is entered, don't provide any completions
         if " " in text_before_cursor:
             return
 
+        # Drop cached results computed from a trie replaced by refresh_commands()
+        if self._cached_trie is not _COMMAND_TRIE:
+            self._prefix_cache = {}
+            self._cached_trie = _COMMAND_TRIE
+
+        # The same prefix always yields the same completions, so reuse earlier results
+        completions = self._prefix_cache.get(text_before_cursor)
+        if completions is None:
+            start_pos = -len(text_before_cursor)
+            completions = tuple(
+                Completion(completion_text, start_position=start_pos)
+                for completion_text in _find_completions(text_before_cursor.lower())
+            )
+            if len(self._prefix_cache) >= _PREFIX_CACHE_SIZE:
+                self._prefix_cache.clear()
+            self._prefix_cache[text_before_cursor] = completions
+
         # Provide completions only for the first word (command)
-        commands, _ = show_help()
-        for command in commands:
-            if command.startswith(text_before_cursor):
-                completion_text = command.split(':', maxsplit=1)[0]
-                start_pos = -len(text_before_cursor)
-                yield Completion(completion_text, start_position=start_pos)
+        yield from completions
 
 
 
 # Initialize the CommandCompleter
 completer = CommandCompleter()
 
-# Save the history file on exit
+# File the command history is read from and appended to
 HISTORY_FILE = '.console_bot_history'
-try:
-    with open(HISTORY_FILE, 'r', encoding='utf-8') as f:
-        history = f.read().splitlines()
-except FileNotFoundError:
-    history = []
+
+def load_history() -> FileHistory:
+    """
+    Creates the command history backed by `HISTORY_FILE`.
+
+    The file is only read when the prompt first needs the history, and every
+    entered command is appended to it.
+
+    Returns:
+        FileHistory: The history object to pass to the prompt.
+    """
+    return FileHistory(HISTORY_FILE)
@@ -2,10 +2,16 @@
 This module provides functions to save and load an AddressBook object using
 the pickle library.
 
+The AddressBook pickles itself as compact rows of plain values (see
+`AddressBook.__getstate__`) rather than as a graph of model objects.
+
+Classes:
+- AddressBookUnpickler: An Unpickler restricted to the classes an address book consists of.
+
 Functions:
-- save_data(book: AddressBook, filename: str = "addressbook.pkl") -> None:
+- save_data(book: AddressBook, filename: Optional[str] = None) -> None:
   Saves the AddressBook object to a file using pickle.
-- load_data(filename: str = "addressbook.pkl") -> AddressBook:
+- load_data(filename: Optional[str] = None) -> AddressBook:
   Loads the AddressBook object from a file using pickle.
 
 Usage:
@@ -14,51 +20,146 @@ AddressBook objects. Each function handles specific operations related to saving
 the AddressBook data.
 """
 
+import copyreg
+import io
 import pickle
 import os
+import zlib
+from datetime import datetime
+from typing import Optional
 
 from bot.models.address_book import AddressBook
+from bot.models.record import Record
+from bot.models.name import Name
+from bot.models.phone import Phone
+from bot.models.email import Email
+from bot.models.address import Address
+from bot.models.birthday import Birthday
+
+# Default location, resolved against the current working directory when it is used
+DEFAULT_FILENAME = os.path.join("tmp", "addressbook.pkl")
+
+# Prefix marking a compressed address book file; files without it are plain pickles
+_COMPRESSED_MAGIC = b"ZPKL"
 
-file_path = os.path.abspath("tmp/addressbook.pkl")
+# zlib level 1 keeps compression cheap while still shrinking the file considerably
+_COMPRESSION_LEVEL = 1
+
+# Directories already created by save_data, so repeated saves skip os.makedirs
+_ensured_dirs: set = set()
+
+# Every global an address book file may reference. The current format only needs
+# AddressBook; the rest are used by files that pickled the model objects directly.
+_ALLOWED_CLASSES = {
+    ("bot.models.address_book", "AddressBook"): AddressBook,
+    ("bot.models.record", "Record"): Record,
+    ("bot.models.name", "Name"): Name,
+    ("bot.models.phone", "Phone"): Phone,
+    ("bot.models.email", "Email"): Email,
+    ("bot.models.address", "Address"): Address,
+    ("bot.models.birthday", "Birthday"): Birthday,
+    ("datetime", "datetime"): datetime,
+    ("copyreg", "_reconstructor"): copyreg._reconstructor,
+    ("builtins", "object"): object,
+}
+
+class AddressBookUnpickler(pickle.Unpickler):
+    """
+    An Unpickler that resolves globals from a fixed table instead of importing them.
 
-def save_data(book: AddressBook, filename: str = file_path) -> None:
+    This skips the import and attribute lookup pickle does for every global and refuses
+    any class that does not belong to an address book.
     """
-    Saves the AddressBook object to a file using pickle.
+
+    def find_class(self, module, name):
+        """
+        Returns the class registered for the given module and name.
+
+        Raises:
+            pickle.UnpicklingError: If the global is not part of an address book.
+        """
+        try:
+            return _ALLOWED_CLASSES[(module, name)]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                f"Global '{module}.{name}' is not allowed in an address book file"
+            ) from None
+
+def save_data(book: AddressBook, filename: Optional[str] = None) -> None:
+    """
+    Saves the AddressBook object to a file using the highest available pickle protocol.
+
+    The pickle is compressed with zlib behind a `ZPKL` prefix. It is written to a temporary
+    file first and then moved over the target, so the previous file stays intact if saving
+    is interrupted.
 
     Args:
     - book (AddressBook): The AddressBook object to be saved.
-    - filename (str): The name of the file to save the object to. Defaults to "addressbook.pkl".
+    - filename (str, optional): The name of the file to save the object to.
+    Defaults to "tmp/addressbook.pkl" in the current working directory.
 
     Returns:
     - None: This function does not return a value.
     """
+    filename = filename or os.path.abspath(DEFAULT_FILENAME)
     try:
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "wb") as f:
-            pickle.dump(book, f)
+        dirname = os.path.dirname(filename)
+        if dirname not in _ensured_dirs:
+            os.makedirs(dirname, exist_ok=True)
+            _ensured_dirs.add(dirname)
+        buffer = io.BytesIO()
+        pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+        # The compact AddressBook state is a tree of plain values with no shared
+        # references, so the memo table is pure overhead
+        pickler.fast = True
+        pickler.dump(book)
+
+        # Write everything in one call to a temporary file and atomically swap it in,
+        # so an interrupted save never leaves a truncated address book behind
+        tmp_filename = f"{filename}.tmp"
+        with open(tmp_filename, "wb") as f:
+            f.write(_COMPRESSED_MAGIC)
+            f.write(zlib.compress(buffer.getbuffer(), _COMPRESSION_LEVEL))
+        os.replace(tmp_filename, filename)
     except OSError as os_error:
         print(f"An error occurred while accessing the file system: {os_error}")
     except pickle.PickleError as pickle_error:
         print(f"An error occurred while pickling the data: {pickle_error}")
 
 
-def load_data(filename: str = file_path) -> AddressBook:
+def load_data(filename: Optional[str] = None) -> AddressBook:
     """
     Loads the AddressBook object from a file using pickle.
 
+    Both compressed files and plain pickles written by earlier versions are accepted.
+
     Args:
-    - filename (str): The name of the file to load the object from. Defaults to "addressbook.pkl".
+    - filename (str, optional): The name of the file to load the object from.
+    Defaults to "tmp/addressbook.pkl" in the current working directory.
 
     Returns:
     - AddressBook: The loaded AddressBook object. If the file is not
     found, a new AddressBook object is created.
     """
+    filename = filename or os.path.abspath(DEFAULT_FILENAME)
     try:
+        # The file is read in one call; compressed files are decompressed in full anyway
         with open(filename, "rb") as f:
-            return pickle.load(f)
+            raw = f.read()
+        # An empty file holds no contacts
+        if not raw:
+            return AddressBook()
+        if raw.startswith(_COMPRESSED_MAGIC):
+            # Decompressing from a memoryview skips the prefix without copying the file contents
+            raw = zlib.decompress(memoryview(raw)[len(_COMPRESSED_MAGIC):])
+        return AddressBookUnpickler(io.BytesIO(raw)).load()
     except FileNotFoundError:
         return AddressBook()
     except OSError as os_error:
         print(f"An error occurred while accessing the file system: {os_error}")
     except pickle.PickleError as pickle_error:
         print(f"An error occurred while unpickling the data: {pickle_error}")
+    except zlib.error as zlib_error:
+        print(f"An error occurred while decompressing the data: {zlib_error}")
+    except ValueError as value_error:
+        print(f"An error occurred while restoring the contacts: {value_error}")
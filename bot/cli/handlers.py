@@ -33,95 +33,190 @@ of contacts. Each function handles specific operations related to adding, updati
 and retrieving contact information.
 """
 
-from typing import List
-
-from rich.prompt import Prompt
-from rich.console import Console
+from typing import Callable, List, Optional, Set
 
 from bot.models import AddressBook, Record
 from bot.cli.input_error import input_error
 
-from bot.models.phone import Phone
-from bot.models.email import Email
-from bot.models.address import Address
-from bot.models.birthday import Birthday
-
 from bot.utils import print_with_newlines
 
-console = Console()
+# Rich is only needed by the interactive handlers, so it is imported on first use
+_console = None
+
+def _get_console():
+    """
+    Returns the shared Rich console, importing Rich and creating it on first use.
+
+    Returns:
+        Console: The console used for prompts and colored messages.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+# The command table never changes at runtime, so it is built once at import
+_COMMANDS = (
+    "close",
+    "exit",
+    "hello",
+    "add-contact",
+    "change-contact",
+    "delete-contact",
+    "all-contacts",
+    "search-contact",
+    "show-phones",
+    "show-birthday",
+    "birthdays",
+    "add-note",
+    "change-note",
+    "delete-note",
+    "all-notes",
+    "search-note",
+    "add-note-tag",
+    "delete-note-tag",
+    "help",
+)
+
+# Hashed form of the command table for membership checks
+_COMMANDS_SET = frozenset(_COMMANDS)
+
+_COMMANDS_STR = (
+    "Available commands:\n"
+    "- 'close' or 'exit':   Exit the program.\n"
+    "- 'hello':             Greet the user.\n"
+    "- 'add-contact':       Add a new contact. Guided by user input flow.\n"
+    "                       Usage: add-contact <name>\n"
+    "- 'change-contact':    Update an existing contact. Guided by user input flow.\n"
+    "                       Usage: change-contact <name>\n"
+    "- 'delete-contact':    Remove a contact by name.\n"
+    "                       Usage: delete-contact <name>\n"
+    "- 'all-contacts':      Display all contacts.\n"
+    "- 'search-contact':    Display contacts that match the entered input.\n"
+    "                       Usage: search-contact <input>\n"
+    "- 'show-phones':       Display a contact's phone number/numbers.\n"
+    "                       Usage: show-phones <name>\n"
+    "- 'show-birthday':     Display a contact's birthday.\n"
+    "                       Usage: show-birthday <name>\n"
+    "- 'birthdays':         List upcoming birthdays."
+    "                       By default, lists birthdays within 7 days.\n"
+    "                       Usage: birthdays [<number_of_days>]\n"
+    "- 'add-note':          Add a new note.\n"
+    "                       Usage: add-note <note text>\n"
+    "- 'change-note':       Update an existing note with new text.\n"
+    "                       Usage: change-note <id> <new_text>\n"
+    "- 'delete-note':       Remove a note by ID.\n"
+    "                       Usage: delete-note <id>\n"
+    "- 'all-notes':         Display all notes.\n"
+    "- 'search-note':       Search for notes.\n"
+    "                       Usage by text: search-note <input>\n"
+    "                       Usage by tags: search-note #<tag> [#<tag2> ... #<tagN>]\n"
+    "- 'add-note-tag':      Add a tag to a note.\n"
+    "                       Usage: add-note-tag <id> <tag1> [<tag2> ... <tagN>]\n"
+    "- 'delete-note-tag':   Remove a tag from a note.\n"
+    "                       Usage: delete-note-tag <id> <tag>\n"
+    "- 'help':              Display this help message.\n"
+)
 
 def show_help() -> tuple:
     """
-    Returns a list of available commands and a formatted string for displaying them.
+    Returns the available commands and a formatted string for displaying them.
 
     Returns:
     tuple: A tuple containing:
-        - A list of command strings.
+        - A tuple of command strings.
         - A formatted string listing all commands with descriptions.
+        - A frozenset of the command strings for membership checks.
     """
-    commands = [
-        "close",
-        "exit",
-        "hello",
-        "add-contact",
-        "change-contact",
-        "delete-contact",
-        "all-contacts",
-        "search-contact",
-        "show-phones",
-        "show-birthday",
-        "birthdays",
-        "add-note",
-        "change-note",
-        "delete-note",
-        "all-notes",
-        "search-note",
-        "add-note-tag",
-        "delete-note-tag",
-        "help"
-    ]
-
-    commands_str = (
-        "Available commands:\n"
-        "- 'close' or 'exit':   Exit the program.\n"
-        "- 'hello':             Greet the user.\n"
-        "- 'add-contact':       Add a new contact. Guided by user input flow.\n"
-        "                       Usage: add-contact <name>\n"
-        "- 'change-contact':    Update an existing contact. Guided by user input flow.\n"
-        "                       Usage: change-contact <name>\n"
-        "- 'delete-contact':    Remove a contact by name.\n"
-        "                       Usage: delete-contact <name>\n"
-        "- 'all-contacts':      Display all contacts.\n"
-        "- 'search-contact':    Display contacts that match the entered input.\n"
-        "                       Usage: search-contact <input>\n"
-        "- 'show-phones':       Display a contact's phone number/numbers.\n"
-        "                       Usage: show-phones <name>\n"
-        "- 'show-birthday':     Display a contact's birthday.\n"
-        "                       Usage: show-birthday <name>\n"
-        "- 'birthdays':         List upcoming birthdays."
-        "                       By default, lists birthdays within 7 days.\n"
-        "                       Usage: birthdays [<number_of_days>]\n"
-        "- 'add-note':          Add a new note.\n"
-        "                       Usage: add-note <note text>\n"
-        "- 'change-note':       Update an existing note with new text.\n"
-        "                       Usage: change-note <id> <new_text>\n"
-        "- 'delete-note':       Remove a note by ID.\n"
-        "                       Usage: delete-note <id>\n"
-        "- 'all-notes':         Display all notes.\n"
-        "- 'search-note':       Search for notes.\n"
-        "                       Usage by text: search-note <input>\n"
-        "                       Usage by tags: search-note #<tag> [#<tag2> ... #<tagN>]\n"
-        "- 'add-note-tag':      Add a tag to a note.\n"
-        "                       Usage: add-note-tag <id> <tag1> [<tag2> ... <tagN>]\n"
-        "- 'delete-note-tag':   Remove a tag from a note.\n"
-        "                       Usage: delete-note-tag <id> <tag>\n"
-        "- 'help':              Display this help message.\n"
-    )
-
-    return commands, commands_str
+    return _COMMANDS, _COMMANDS_STR, _COMMANDS_SET
 
 #------------------------------------------------------------------
 
+def _name(args: List[str]) -> str:
+    """
+    Joins the command arguments into the contact name used as the address book key.
+
+    Args:
+        args (List[str]): The words of the contact name.
+
+    Returns:
+        str: The contact name.
+    """
+    return " ".join(args)
+
+def _is_sentinel(value: str, word: str) -> bool:
+    """
+    Checks case-insensitively whether a prompt answer is a control word such as 'n' or 'back'.
+
+    The length is compared first, so ordinary answers are rejected without lowercasing them.
+
+    Args:
+        value (str): The answer entered by the user.
+        word (str): The lowercase control word.
+
+    Returns:
+        bool: True if the answer is the control word.
+    """
+    return len(value) == len(word) and value.lower() == word
+
+def _collect_field(
+    console,
+    field_name: str,
+    add_fn: Callable[[str], None],
+    seen: Optional[Set[str]] = None,
+    once: bool = False,
+    hint: str = ""
+) -> None:
+    """
+    Prompts for values of one contact field until the user enters 'n' to skip.
+
+    Empty values are rejected, values already in `seen` are reported as duplicates
+    and validation errors raised by `add_fn` are printed before prompting again.
+
+    Args:
+        console (Console): The Rich console used for prompts and messages.
+        field_name (str): The field name used in the prompt and messages, e.g. "phone number".
+        add_fn (Callable[[str], None]): The function that validates and adds a value.
+        seen (Optional[Set[str]]): The values already added, for fields that hold several
+            values. Each added value is put into it.
+        once (bool): Whether to stop prompting after the first value is added.
+        hint (str): Extra text shown after the field name in the prompt.
+    """
+    from rich.prompt import Prompt
+
+    while True:
+        value = Prompt.ask(
+            f"\n[cyan]Enter {field_name}{hint} "
+            "(or '[dark_orange]n[/dark_orange]' to skip)[/cyan]",
+            console=console
+        )
+        if _is_sentinel(value, "n"):
+            break
+        if not value.strip():
+            console.print(
+                f"[red]{field_name.capitalize()} cannot be empty. "
+                "Enter '[cyan]n[/cyan]' to skip.[/red]"
+            )
+            continue
+        if seen is not None and value in seen:
+            console.print(
+                f"[yellow]This {field_name} already exists in the contact.[/yellow]"
+            )
+            console.print(
+                "[yellow]Please enter a different one.[/yellow]"
+            )
+            continue
+        try:
+            add_fn(value)
+        except ValueError as e:
+            console.print(f"[red]Error adding {field_name}:[/red] {e}")
+            continue
+        if seen is not None:
+            seen.add(value)
+        if once:
+            break
+
 @input_error
 def add_contact(args: List[str], address_book: AddressBook) -> str:
     """
@@ -140,7 +235,8 @@ def add_contact(args: List[str], address_book: AddressBook) -> str:
         str: A message indicating whether the contact was added successfully or if it 
              already exists.
     """
-    name_str = " ".join(args)
+    console = _get_console()
+    name_str = _name(args)
 
     record = address_book.find(name_str)
 
@@ -150,97 +246,242 @@ def add_contact(args: List[str], address_book: AddressBook) -> str:
             "If you want to update it, use the command: change <contact_name>."
         )
 
+    from bot.models.phone import Phone
+    from bot.models.email import Email
+
     record = Record(name_str)
 
+    # Phones and emails are validated as they are entered and added to the record in one batch
+    pending_phones = []
+    pending_emails = []
+    _collect_field(
+        console, "phone number",
+        lambda value: pending_phones.append(Phone(value).value),
+        seen=set()
+    )
+    _collect_field(
+        console, "email",
+        lambda value: pending_emails.append(Email(value).address),
+        seen=set()
+    )
+    record.extend_phones(pending_phones)
+    record.extend_emails(pending_emails)
+    _collect_field(console, "address", record.add_address, once=True)
+    _collect_field(console, "birthday", record.add_birthday, once=True, hint=" (DD.MM.YYYY)")
+
+    address_book.add_record(record)
+    return "Contact added successfully."
+
+#------------------------------------------------------------------
+
+# Map the menu numbers to the editable fields
+_FIELD_MAP = {
+    "1": "name",
+    "2": "phones",
+    "3": "emails",
+    "4": "address",
+    "5": "birthday"
+}
+
+# Value extractors for the contact field objects, keyed by their exact type.
+# Built on first use so the field classes are only imported by change_contact.
+_EXTRACTORS = None
+
+def _get_extractors() -> dict:
+    """
+    Returns the type-keyed value extractors, building them on first use.
+
+    Returns:
+        dict: A mapping of field class to a function returning the field's value as a string.
+    """
+    global _EXTRACTORS
+    if _EXTRACTORS is None:
+        from bot.models.phone import Phone
+        from bot.models.email import Email
+        from bot.models.address import Address
+        from bot.models.birthday import Birthday
+
+        _EXTRACTORS = {
+            Phone: lambda obj: obj.value,
+            Email: lambda obj: obj.address,
+            Address: lambda obj: obj.value,
+            Birthday: lambda obj: obj.formatted
+        }
+    return _EXTRACTORS
+
+def _extract_value(obj) -> str:
+    """
+    Extracts the underlying value of a contact field object for display and comparison.
+
+    Args:
+        obj: A Phone, Email, Address or Birthday instance.
+
+    Returns:
+        str: The field's value as a string.
+    """
+    return _get_extractors().get(type(obj), str)(obj)
+
+def _edit_name(record: Record, selected_field: str, address_book: AddressBook) -> None:
+    """
+    Prompts for a new contact name and renames the contact in the address book.
+
+    Args:
+        record (Record): The contact being edited.
+        selected_field (str): The field being edited, always "name".
+        address_book (AddressBook): The address book the contact is stored under.
+    """
+    from rich.prompt import Prompt
+
+    console = _get_console()
     while True:
-        phone_str = Prompt.ask(
-            "\n[cyan]Enter phone number (or '[dark_orange]n[/dark_orange]' to skip)[/cyan]",
-            console=console
-        )
-        if phone_str.lower() == "n":
+        new_value = Prompt.ask("Enter the new name (or type 'back' to cancel)")
+        if _is_sentinel(new_value, 'back'):
             break
-        if not phone_str.strip():
-            console.print(
-                "[red]Phone number cannot be empty. Enter '[cyan]n[/cyan]' to skip.[/red]"
-            )
-            continue
-        if phone_str in [phone.value for phone in record.phones]:
-            console.print(
-                "[yellow]This phone number already exists in the contact.[/yellow]"
-            )
-            console.print(
-                "[yellow]Please enter a different one.[/yellow]"
-            )
-            continue
         try:
-            record.add_phone(phone_str)
+            result = record.edit_field(selected_field, None, new_value, address_book)
+            console.print(f"[green]{result}[/green]")
+            break
         except ValueError as e:
-            console.print(f"[red]Error adding phone number:[/red] {e}")
-            continue
+            console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
 
-    while True:
-        email = Prompt.ask(
-            "\n[cyan]Enter email (or '[dark_orange]n[/dark_orange]' to skip)[/cyan]",
-            console=console
+def _edit_list_field(record: Record, selected_field: str, address_book: AddressBook) -> None:
+    """
+    Prompts to edit, remove or add a value of a list field (phones or emails).
+
+    Args:
+        record (Record): The contact being edited.
+        selected_field (str): The field being edited, "phones" or "emails".
+        address_book (AddressBook): The address book the contact is stored under (unused).
+    """
+    from rich.prompt import Prompt
+
+    console = _get_console()
+    old_value = None
+    current_values = getattr(record, selected_field, None)
+
+    extracted_values = (
+        [_extract_value(value) for value in current_values]
+        if current_values else []
+    )
+    # Hashed lookups for the existence and duplicate checks below
+    extracted_set = set(extracted_values)
+
+    if not extracted_values:
+        console.print(
+            f"[yellow]No current {selected_field} found. "
+            "Switching to add mode.[/yellow]"
         )
-        if email.lower() == "n":
-            break
-        if not email.strip():
+        action = "add"
+    else:
+        prompt_message = (
+            f"Would you like to edit an existing {selected_field[:-1]} or "
+            "add a new one? (edit/add or type 'back' to cancel)"
+        )
+        action = Prompt.ask(prompt_message, default="add").lower()
+
+    # Handle exit action
+    if action == "back":
+        return  # Return to the field selection menu
+
+    if action == "edit":
+        console.print(f"[cyan]Current {selected_field}:[/cyan] {extracted_values}")
+        old_value = Prompt.ask(
+            f"Enter the current {selected_field[:-1]} to be replaced "
+            "(or type 'back' to cancel)"
+        )
+        if _is_sentinel(old_value, 'back'):
+            return
+
+        if old_value not in extracted_set:
             console.print(
-                "[red]Email cannot be empty. Enter '[cyan]n[/cyan]' to skip.[/red]"
+                f"[red]The {selected_field[:-1]} '{old_value}' "
+                "does not exist.[/red]"
             )
-            continue
-        if email in [email.address for email in record.emails]:
-            console.print(
-                "[yellow]This email already exists in the contact.[/yellow]"
+            return
+
+    # Editing or adding loop with exception handling
+    while True:
+        if action == "add":
+            prompt_message = (
+                f"Enter the new value for {selected_field[:-1]} "
+                "(or type 'back' to cancel)"
             )
-            console.print(
-                "[yellow]Please enter a different one.[/yellow]"
+        else:  # Режим редагування
+            prompt_message = (
+                f"Enter the new value for {selected_field[:-1]} "
+                "(leave empty to remove or type 'back' to cancel)"
             )
-            continue
-        try:
-            record.add_email(email)
-        except ValueError as e:
-            console.print(f"[red]Error adding email:[/red] {e}")
-            continue
 
-    while True:
-        address = Prompt.ask(
-            "\n[cyan]Enter address (or '[dark_orange]n[/dark_orange]' to skip)[/cyan]",
-            console=console
-        )
-        if address.lower() == "n":
+        new_value = Prompt.ask(prompt_message, default="")
+        if _is_sentinel(new_value, 'back'):
             break
-        if not address.strip():
-            console.print("[red]Address cannot be empty. Enter '[cyan]n[/cyan]' to skip.[/red]")
-            continue
+
         try:
-            record.add_address(address)
-            break
+            if new_value.strip() == "" and old_value:
+                result = record.edit_field(selected_field, old_value, None)
+                console.print(
+                    f"[green]{selected_field[:-1].capitalize()} "
+                    f"'{old_value}' has been removed.[/green]"
+                )
+                break
+
+            # Handle duplication check
+            elif new_value.strip() != "":
+                if new_value in extracted_set:
+                    console.print(
+                        f"[red]The {selected_field[:-1]} '{new_value}' "
+                        "is already in the list.[/red]"
+                    )
+                    continue
+
+                result = record.edit_field(selected_field, old_value, new_value)
+                console.print(f"[green]{result}[/green]")
+                break
         except ValueError as e:
-            console.print(f"[red]Error adding address:[/red] {e}")
+            console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
+
+def _edit_scalar_field(record: Record, selected_field: str, address_book: AddressBook) -> None:
+    """
+    Prompts for a new value of a single-valued field (address or birthday).
+
+    Args:
+        record (Record): The contact being edited.
+        selected_field (str): The field being edited, "address" or "birthday".
+        address_book (AddressBook): The address book the contact is stored under (unused).
+    """
+    from rich.prompt import Prompt
 
+    console = _get_console()
+    current_values = getattr(record, selected_field, None)
+    current_value = _extract_value(current_values) if current_values else None
+
+    if current_value:
+        console.print(f"[cyan]Current {selected_field}:[/cyan] {current_value}")
+
+    # Editing loop for Address and Birthday with exception handling
     while True:
-        birthday = Prompt.ask(
-            "\n[cyan]Enter birthday (DD.MM.YYYY) "
-            "(or '[dark_orange]n[/dark_orange]' to skip)[/cyan]",
-            console=console
+        new_value = Prompt.ask(
+            f"Enter the new value for {selected_field} "
+            "(this will overwrite the existing value, or type 'back' to cancel)"
         )
-        if birthday.lower() == "n":
+        if _is_sentinel(new_value, 'back'):
             break
-        if not birthday.strip():
-            console.print("[red]Birthday cannot be empty. Enter '[cyan]n[/cyan]' to skip.[/red]")
-            continue
+
         try:
-            record.add_birthday(birthday)
+            result = record.edit_field(selected_field, None, new_value)
+            console.print(f"[green]{result}[/green]")
             break
         except ValueError as e:
-            console.print(f"[red]Error adding birthday:[/red] {e}")
+            console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
 
-    address_book.add_record(record)
-    return "Contact added successfully."
-
-#------------------------------------------------------------------
+# Field name -> editor prompting for and applying the change
+_FIELD_HANDLERS = {
+    "name": _edit_name,
+    "phones": _edit_list_field,
+    "emails": _edit_list_field,
+    "address": _edit_scalar_field,
+    "birthday": _edit_scalar_field,
+}
 
 @input_error
 def change_contact(args: List[str], address_book: AddressBook) -> str:
@@ -261,34 +502,15 @@ def change_contact(args: List[str], address_book: AddressBook) -> str:
         str: A message indicating the result of the update operation, including success or 
              errors encountered during the process.
     """
-    name_str = " ".join(args)
+    from rich.prompt import Prompt
+
+    console = _get_console()
+    name_str = _name(args)
     record = address_book.find(name_str)
 
     if not record:
         return f"Contact '{name_str}' not found. Please check the name."
 
-    # Map the numbers to fields
-    field_map = {
-        "1": "name",
-        "2": "phones",
-        "3": "emails",
-        "4": "address",
-        "5": "birthday"
-    }
-
-    # Function to extract the underlying value from the object
-    def extract_value(obj):
-        if isinstance(obj, Phone):
-            return obj.value
-        elif isinstance(obj, Email):
-            return obj.address
-        elif isinstance(obj, Address):
-            return obj.value
-        elif isinstance(obj, Birthday):
-            return obj.value.strftime("%d.%m.%Y")
-        else:
-            return str(obj)
-
     while True:
         print_with_newlines(
             address_book.show_single_contact(record),
@@ -311,148 +533,19 @@ def change_contact(args: List[str], address_book: AddressBook) -> str:
             console=console
         )
 
-        if field_to_edit.lower() == 'exit':
+        if _is_sentinel(field_to_edit, 'exit'):
             break
 
-        if field_to_edit not in field_map:
+        if field_to_edit not in _FIELD_MAP:
             console.print(
                 "[red]Invalid option. "
                 "Please choose a valid number or 'exit' to stop.[/red]"
             )
             continue
 
-        selected_field = field_map[field_to_edit]
-
-        # Show all contact information before editing
-        console.print("[cyan]Current contact information:[/cyan]")
-        print_with_newlines(
-            address_book.show_single_contact(record),
-            lines_before=0,
-            lines_after=0,
-            use_rich_print=False
-        )
-
-        # Handle Name Editing
-        if selected_field == "name":
-            while True:
-                new_value = Prompt.ask("Enter the new name (or type 'back' to cancel)")
-                if new_value.lower() == 'back':
-                    break
-                try:
-                    result = record.edit_field(selected_field, None, new_value, address_book)
-                    console.print(f"[green]{result}[/green]")
-                    name_str = new_value  # Update the name if changed
-                    break
-                except ValueError as e:
-                    console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
-
-        else:
-            old_value = None
-            current_values = getattr(record, selected_field, None)
-
-            # Handle fields that store lists (Phones, Emails)
-            if selected_field in ["phones", "emails"]:
-                extracted_values = (
-                    [extract_value(value) for value in current_values]
-                    if current_values else []
-                )
-
-                if not extracted_values:
-                    console.print(
-                        f"[yellow]No current {selected_field} found. "
-                        "Switching to add mode.[/yellow]"
-                    )
-                    action = "add"
-                else:
-                    prompt_message = (
-                        f"Would you like to edit an existing {selected_field[:-1]} or "
-                        "add a new one? (edit/add or type 'back' to cancel)"
-                    )
-                    action = Prompt.ask(prompt_message, default="add").lower()
+        selected_field = _FIELD_MAP[field_to_edit]
 
-                # Handle exit action
-                if action == "back":
-                    continue  # Return to the field selection menu
-
-                if action == "edit":
-                    console.print(f"[cyan]Current {selected_field}:[/cyan] {extracted_values}")
-                    old_value = Prompt.ask(
-                        f"Enter the current {selected_field[:-1]} to be replaced "
-                        "(or type 'back' to cancel)"
-                    )
-                    if old_value.lower() == 'back':
-                        continue
-
-                    if old_value not in extracted_values:
-                        console.print(
-                            f"[red]The {selected_field[:-1]} '{old_value}' "
-                            "does not exist.[/red]"
-                        )
-                        continue
-
-                # Editing or adding loop with exception handling
-                while True:
-                    if action == "add":
-                        prompt_message = (
-                            f"Enter the new value for {selected_field[:-1]} "
-                            "(or type 'back' to cancel)"
-                        )
-                    else:  # Режим редагування
-                        prompt_message = (
-                            f"Enter the new value for {selected_field[:-1]} "
-                            "(leave empty to remove or type 'back' to cancel)"
-                        )
-
-                    new_value = Prompt.ask(prompt_message, default="")
-                    if new_value.lower() == 'back':
-                        break
-
-                    try:
-                        if new_value.strip() == "" and old_value:
-                            result = record.edit_field(selected_field, old_value, None)
-                            console.print(
-                                f"[green]{selected_field[:-1].capitalize()} "
-                                f"'{old_value}' has been removed.[/green]"
-                            )
-                            break
-
-                        # Handle duplication check
-                        elif new_value.strip() != "":
-                            if new_value in extracted_values:
-                                console.print(
-                                    f"[red]The {selected_field[:-1]} '{new_value}' "
-                                    "is already in the list.[/red]"
-                                )
-                                continue
-
-                            result = record.edit_field(selected_field, old_value, new_value)
-                            console.print(f"[green]{result}[/green]")
-                            break
-                    except ValueError as e:
-                        console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
-
-            # Handle fields (Address, Birthday) with exception handling
-            elif selected_field in ["address", "birthday"]:
-                current_value = extract_value(current_values) if current_values else None
-
-                if current_value:
-                    console.print(f"[cyan]Current {selected_field}:[/cyan] {current_value}")
-
-                # Editing loop for Address and Birthday with exception handling
-                while True:
-                    new_value = Prompt.ask(
-                        f"Enter the new value for {selected_field} "
-                        "(this will overwrite the existing value, or type 'back' to cancel)"
-                    )
-                    if new_value.lower() == 'back':
-                        break
-
-                    try:
-                        result = record.edit_field(selected_field, None, new_value)
-                        console.print(f"[green]{result}[/green]")
-                        break
-                    except ValueError as e:
-                        console.print(f"[red]Error: {str(e)}. Please try again.[/red]")
+        _FIELD_HANDLERS[selected_field](record, selected_field, address_book)
 
     return "Contact updated successfully."
 
@@ -478,13 +571,14 @@ def delete_contact(args: List[str], address_book: AddressBook) -> str:
     if len(args) < 1:
         return "Please provide the name of the contact to delete."
 
-    contact_name = " ".join(args)
+    contact_name = _name(args)
 
-    if contact_name in address_book:
+    try:
         address_book.delete(contact_name)
-        return f"Contact '{contact_name}' has been deleted."
+    except KeyError:
+        return f"Contact '{contact_name}' not found."
 
-    return f"Contact '{contact_name}' not found."
+    return f"Contact '{contact_name}' has been deleted."
 
 #------------------------------------------------------------------
 
@@ -524,13 +618,11 @@ def search_contact(args: List[str], address_book: AddressBook) -> str:
     to be searched.
 
     Returns:
-    str: A string with the matching contacts, or a message indicating no matches were found.
-    
-    Raises:
-    ValueError: If no search input is provided in the `args` list.
+    str: A string with the matching contacts, or a message indicating no matches were found
+    or that no search input was provided.
     """
-    if len(args) == 0:
-        raise ValueError("No search input provided.")
+    if not args:
+        return "No search input provided."
 
     matches = address_book.search_in_fields(args)
 
@@ -557,7 +649,7 @@ def show_phones(args: List[str], address_book: AddressBook) -> str:
     if len(args) < 1:
         return "Insufficient arguments. Usage: phone <name>"
 
-    name_str = " ".join(args)
+    name_str = _name(args)
     record = address_book.find(name_str)
 
     if not record:
@@ -589,7 +681,7 @@ def show_birthday(args: List[str], address_book: AddressBook) -> str:
     if len(args) < 1:
         return "Insufficient arguments. Usage: show-birthday <name>"
 
-    name_str = " ".join(args)
+    name_str = _name(args)
     record = address_book.find(name_str)
 
     if not record:
@@ -599,6 +691,9 @@ def show_birthday(args: List[str], address_book: AddressBook) -> str:
 
 #------------------------------------------------------------------
 
+# Number of days listed by `birthdays` when no argument is given
+_DEFAULT_BIRTHDAY_DAYS = 7
+
 @input_error
 def birthdays(args: List[str], address_book: AddressBook) -> str:
     """
@@ -621,11 +716,14 @@ def birthdays(args: List[str], address_book: AddressBook) -> str:
     that the number of days must be an integer.
     - If the address book is empty, a message indicating there are no contacts is returned.
     """
-    if len(args) == 0:
-        days = 7
+    if not args:
+        days = _DEFAULT_BIRTHDAY_DAYS
     elif len(args) > 1:
         return "Too many arguments. Usage: show-birthday <days>"
+    elif args[0].isdecimal():
+        days = int(args[0])
     else:
+        # Signed and other forms accepted by int() still go through it
         try:
             days = int(args[0])
         except ValueError:
@@ -5,8 +5,34 @@ The `input_error` decorator manages errors such as missing arguments,
 invalid values, and missing keys.
 """
 
+from functools import wraps
 from typing import Callable, Any
 
+# Message returned when a handled exception carries no message of its own
+_DEFAULT_MESSAGES = {
+    ValueError: "Give me name and phone, please.",
+    KeyError: "Contact not found.",
+    IndexError: "Give me name, please.",
+}
+
+_HANDLED_ERRORS = tuple(_DEFAULT_MESSAGES)
+
+def _default_message(exc: Exception) -> str:
+    """
+    Returns the default message for a handled exception, also for subclasses
+    such as UnicodeError.
+
+    Args:
+        exc (Exception): The caught exception.
+
+    Returns:
+        str: The default message of the nearest handled base class.
+    """
+    for cls in type(exc).__mro__:
+        if cls in _DEFAULT_MESSAGES:
+            return _DEFAULT_MESSAGES[cls]
+    return str(exc)
+
 def input_error(func: Callable[..., str]) -> Callable[..., str]:
     """
     Decorator to handle input errors in functions that process user input.
@@ -17,14 +43,11 @@ def input_error(func: Callable[..., str]) -> Callable[..., str]:
     Returns:
         Callable[..., str]: A decorated function that handles input errors.
     """
+    @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> str:
         try:
             return func(*args, **kwargs)
-        except ValueError as exc:
-            return str(exc) if str(exc) else "Give me name and phone, please."
-        except KeyError as exc:
-            return str(exc) if str(exc) else "Contact not found."
-        except IndexError as exc:
-            return str(exc) if str(exc) else "Give me name, please."
+        except _HANDLED_ERRORS as exc:
+            return str(exc) or _default_message(exc)
 
     return wrapper
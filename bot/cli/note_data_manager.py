@@ -3,9 +3,9 @@ This module provides functions to save and load a NoteBook object using
 the pickle library.
 
 Functions:
-- save_data(book: NoteBook, filename: str = "notebook.pkl") -> None:
+- save_data(book: NoteBook, filename: Optional[str] = None) -> None:
   Saves the NoteBook object to a file using pickle.
-- load_data(filename: str = "notebook.pkl") -> NoteBook:
+- load_data(filename: Optional[str] = None) -> NoteBook:
   Loads the NoteBook object from a file using pickle.
 
 Usage:
@@ -16,38 +16,49 @@ the NoteBook data.
 
 import pickle
 import os
+from typing import Optional
 
 from bot.models.note_book import NoteBook
 
-file_path = os.path.abspath("tmp/notebook.pkl")
+# Default location, resolved against the current working directory when it is used
+DEFAULT_FILENAME = os.path.join("tmp", "notebook.pkl")
 
-def save_data(book: NoteBook, filename: str = file_path) -> None:
+# Large I/O buffer so the pickle is written and read with as few syscalls as possible
+_BUFFER_SIZE = 1 << 20
+
+def save_data(book: NoteBook, filename: Optional[str] = None) -> None:
     """
-    Saves the NoteBook object to a file using pickle.
+    Saves the NoteBook object to a file using the highest available pickle protocol.
 
     Args:
     - book (NoteBook): The NoteBook object to be saved.
-    - filename (str): The name of the file to save the object to. Defaults to "notebook.pkl".
+    - filename (str, optional): The name of the file to save the object to.
+    Defaults to "tmp/notebook.pkl" in the current working directory.
 
     Returns:
     - None: This function does not return a value.
     """
-    with open(filename, "wb") as f:
-        pickle.dump(book, f)
+    filename = filename or os.path.abspath(DEFAULT_FILENAME)
+    with open(filename, "wb", buffering=_BUFFER_SIZE) as f:
+        # The pickler writes framed chunks straight into the file buffer,
+        # so the whole serialized notebook is never held in memory at once
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
 
-def load_data(filename: str = file_path) -> NoteBook:
+def load_data(filename: Optional[str] = None) -> NoteBook:
     """
     Loads the NoteBook object from a file using pickle.
 
     Args:
-    - filename (str): The name of the file to load the object from. Defaults to "notebook.pkl".
+    - filename (str, optional): The name of the file to load the object from.
+    Defaults to "tmp/notebook.pkl" in the current working directory.
 
     Returns:
-    - NoteBook: The loaded NoteBook object. If the file is not found,
+    - NoteBook: The loaded NoteBook object. If the file is not found or empty,
     a new NoteBook object is created.
     """
+    filename = filename or os.path.abspath(DEFAULT_FILENAME)
     try:
-        with open(filename, "rb") as f:
+        with open(filename, "rb", buffering=_BUFFER_SIZE) as f:
             return pickle.load(f)
-    except FileNotFoundError:
+    except (FileNotFoundError, EOFError):
         return NoteBook()
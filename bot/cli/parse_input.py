@@ -14,12 +14,18 @@ def parse_input(user_input: str) -> tuple:
     user_input (str): The input string from the user containing the command and optional arguments.
 
     Returns:
-    tuple: A tuple containing the command (str) and its arguments (list of str).
+    tuple: A tuple containing the lowercased command (str) followed by its arguments (str).
+    The command is an empty string if the input is blank.
 
     Example:
     >>> parse_input("Search file.txt")
-    ('search', ['file.txt'])
+    ('search', 'file.txt')
     """
-    cmd, *args = user_input.split()
-    cmd = cmd.strip().lower()
-    return cmd, *args
+    # Only the command is split off and lowercased; the rest is split once
+    parts = user_input.split(None, 1)
+    if not parts:
+        return ("",)
+    cmd = parts[0].lower()
+    if len(parts) == 1:
+        return (cmd,)
+    return (cmd, *parts[1].split())
@@ -11,6 +11,15 @@ Example usage:
 import re
 from .field import Field
 
+# Compiled once at import instead of being looked up in the re cache per address
+_ADDRESS_RE = re.compile(r'^[\w\s,]*$')
+
+# The ASCII characters matched by _ADDRESS_RE, for a set-based check of ASCII addresses
+_ASCII_ADDRESS_CHARS = frozenset(
+    char for char in map(chr, range(128))
+    if char.isalnum() or char.isspace() or char in ",_"
+)
+
 class Address(Field):
     """
     A class representing a street address with basic validation.
@@ -26,6 +35,8 @@ class Address(Field):
             Initializes a new Address instance with validation.
     """
 
+    __slots__ = ()
+
     def __init__(self, address: str) -> None:
         """
         Initializes a new Address instance with a given value,
@@ -41,13 +52,15 @@ class Address(Field):
         Raises:
             ValueError: If the address does not match the pattern for a basic street address format.
         """
-        address_pattern = r'^[\w\s,]*$'
+        if address.isascii():
+            valid = _ASCII_ADDRESS_CHARS.issuperset(address)
+        else:
+            valid = _ADDRESS_RE.fullmatch(address) is not None
 
-        if not re.fullmatch(address_pattern, address):
+        if not valid:
             raise ValueError(
                 "Invalid address format. The address must contain only alphanumeric characters. "
                 "Spaces, commas, and numbers are allowed. "
                 "Please ensure your address follows this pattern."
             )
-        self.value = address
         super().__init__(address)
@@ -2,11 +2,10 @@
 This module provides the AddressBook class, which is used to manage a collection of contact records.
 
 Classes:
-- AddressBook: A class that extends UserDict to manage a collection of contact records. 
+- AddressBook: A dict subclass that manages a collection of contact records. 
   It supports adding, finding, searching, deleting contacts, and displaying information about them.
 
 Imports:
-- UserDict from collections: A dictionary-like class that allows extension and customization.
 - Record from .record: A class representing a contact record, which includes contact name and
 phone numbers.
 - Birthday from bot.models.birthday: A class representing a birthday.
@@ -29,23 +28,106 @@ Example:
     all_contacts_info = address_book.show_all_contacts()
 """
 
+import sys
+from bisect import bisect_left
 from datetime import datetime, timedelta, date
-from typing import Optional, List
-from collections import UserDict
-
-from io import StringIO
-from rich.table import Table
-from rich.console import Console
+from typing import TYPE_CHECKING, Optional, List
 
 from bot.models.birthday import Birthday
 from .record import Record
 
-class AddressBook(UserDict):
+# Rich is imported on first render, so loading the models does not pay for it
+if TYPE_CHECKING:
+    from rich.table import Table
+    from rich.console import Console
+
+# Order of the values in each row of the pickled AddressBook state
+_STATE_FIELDS = ("name", "phones", "emails", "address", "birthday")
+
+# Maximum number of rendered single-contact tables kept by show_single_contact
+_CONTACT_CACHE_SIZE = 128
+
+# Days to add to a date to move it off the weekend, indexed by date.weekday():
+# Saturday moves to Monday (+2), Sunday moves to Monday (+1)
+_WEEKDAY_SHIFT = tuple(timedelta(days=shift) for shift in (0, 0, 0, 0, 0, 2, 1))
+
+# Columns of the contact detail and contact list tables: header and add_column options
+_CONTACT_COLUMNS = (
+    ("Name\n", {"style": "dark_orange", "width": 20}),
+    ("Phones\n", {"style": "green", "justify": "center", "width": 16}),
+    ("Emails\n", {"style": "green", "justify": "center", "width": 30}),
+    ("Address\n", {"style": "green", "justify": "center"}),
+    ("Birthday\n", {"style": "green", "justify": "center", "width": 16}),
+)
+
+def _make_contacts_table(title: str) -> "Table":
+    """
+    Creates an empty contact table with the `_CONTACT_COLUMNS` columns.
+
+    Args:
+        title (str): The title of the table.
+
+    Returns:
+        Table: The table, ready for `AddressBook._contact_row` rows.
+    """
+    from rich.table import Table
+
+    table = Table(
+        title=title,
+        title_style="bold orange1",
+        border_style="gray50",
+        padding=(0, 2),
+        show_header=True,
+        show_lines=True,
+        header_style="bold cyan"
+    )
+    for header, options in _CONTACT_COLUMNS:
+        table.add_column(header, **options)
+    return table
+
+# Console shared by all address books, created on first use
+_console = None
+
+def _get_console() -> "Console":
+    """
+    Returns the shared Rich console, creating it on first use.
+
+    Returns:
+        Console: The console used to print and render the address book tables.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def _render(console: "Console", table: "Table") -> str:
+    """
+    Renders a table to a string with the console's width and color settings.
+
+    Args:
+        console (Console): The console to render with.
+        table (Table): The table to render.
+
+    Returns:
+        str: The rendered table.
+    """
+    with console.capture() as capture:
+        console.print(table)
+    return capture.get()
+
+class AddressBook(dict):
     """
     AddressBook is a collection of contact records that allows adding,
     searching, deleting contacts, and displaying information about them.
 
     Methods:
+        __init__(*args, **kwargs) -> None:
+            Initializes the address book, its render cache and its search index.
+
+        data -> AddressBook:
+            Returns the address book itself, for code written against the former UserDict base.
+
         add_record(record: Record) -> None:
             Adds a new record to the address book.
 
@@ -69,10 +151,54 @@ class AddressBook(UserDict):
         show_all_contacts() -> str:
             Returns a formatted string of all contacts in the address book.
 
+        to_dict() -> dict:
+            Converts the address book to a dict of plain, serializable values.
+
+        from_dict(data: dict) -> AddressBook:
+            Creates an address book from a dict produced by `to_dict`.
+
+        __reduce__() -> tuple:
+            Pickles the address book through its compact state only.
+
+        __getstate__() -> list:
+            Returns the compact pickle state: one tuple of plain values per record.
+
+        __setstate__(state: list) -> None:
+            Rebuilds the address book from a pickle state.
+
         __str__() -> str:
             Returns a string representation of all records in the address book.
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        """
+        Initializes the address book, its render cache and its birthday index.
+
+        The cache maps id(record) to (record, record version, console width, rendered table).
+        The birthday index is built on the first birthday query, see `_ensure_birthday_index`.
+        Rendered contact list and birthday tables are kept until the next change,
+        see `_cached_render`.
+        """
+        self._contact_cache = {}
+        self._birthday_index = []
+        self._birthday_index_key = None
+        self._render_cache = {}
+        self._render_revision = None
+        super().__init__(*args, **kwargs)
+
+    @property
+    def data(self) -> "AddressBook":
+        """
+        Returns the address book itself.
+
+        The address book used to be a UserDict keeping its records in `data`; it is now
+        a dict subclass, and this keeps `address_book.data` working.
+
+        Returns:
+            AddressBook: This address book.
+        """
+        return self
+
     def add_record(self, record: Record) -> None:
         """
         Adds a new record to the address book.
@@ -80,7 +206,9 @@ class AddressBook(UserDict):
         Args:
             record (Record): The record to be added.
         """
-        self.data[record.name.value] = record
+        # Interned keys let lookups with the stored name string hit on identity
+        self[sys.intern(record.name.value)] = record
+        Record._modifications += 1
 
     def find(self, name: str) -> Optional[Record]:
         """
@@ -92,7 +220,7 @@ class AddressBook(UserDict):
         Returns:
             Optional[Record]: The found record or None if not found.
         """
-        return self.data.get(name, None)
+        return self.get(name, None)
 
     def search_in_fields(self, args: list[str]) -> Optional[List[Record]]:
         """
@@ -105,48 +233,15 @@ class AddressBook(UserDict):
         Returns:
             Optional[List[Record]]: The found records list or None if no matches are found.
         """
-        if not self.data:
+        if not self:
             return "No contacts found."
-        search = [arg.lower() for arg in args]
-        matching_records = []
-        for record in self.data.values():
-            name_check = (
-                record.name and
-                record.name.value.lower().startswith(tuple(search))
-            )
-
-            phones_check = (
-                record.phones and
-                any(phone.value.lower().startswith(tuple(search)) for phone in record.phones)
-            )
-
-            emails_check = (
-                record.emails and
-                any(email.address.lower().startswith(tuple(search)) for email in record.emails)
-            )
-
-            address_check = (
-                record.address and
-                record.address.value.lower().startswith(tuple(search))
-            )
-
-            birthday_check = (
-                isinstance(record.birthday, Birthday) and
-                record.birthday.value.strftime('%d.%m.%Y').startswith(tuple(search))
-            )
-
-            matches = [
-                name_check,
-                phones_check,
-                emails_check,
-                address_check,
-                birthday_check
-            ]
-
-            if any(matches):
-                matching_records.append(record)
+        # Built once per query; repeated terms are dropped so each is checked only once
+        search = tuple(dict.fromkeys(arg.lower() for arg in args))
+        matching_records = self._scan_fields(search)
 
         if len(matching_records) > 0:
+            from rich.table import Table
+
             table = Table(
                 "Name",
                 "Birthday",
@@ -164,17 +259,17 @@ class AddressBook(UserDict):
             for record in matching_records:
                 name = record.name.value
                 birthday = (
-                    record.birthday.value.strftime('%d.%m.%Y')
+                    record.birthday.formatted
                     if record.birthday
                     else '---'
                 )
                 phones = (
-                    ', '.join(phone.value for phone in record.phones) 
+                    record.joined_phones(', ')
                     if record.phones
                     else '---'
                 )
                 emails = (
-                    ', '.join(email.address for email in record.emails) 
+                    record.joined_emails(', ')
                     if record.emails
                     else '---'
                 )
@@ -182,7 +277,7 @@ class AddressBook(UserDict):
 
                 table.add_row(name, birthday, phones, emails, address)
 
-            console = Console()
+            console = _get_console()
             console.print(table)
             return ""
         else:
@@ -194,30 +289,119 @@ class AddressBook(UserDict):
 
         Args:
             name (str): The name of the contact to delete.
+
+        Raises:
+            KeyError: If there is no contact with this name.
+        """
+        del self[name]
+        Record._modifications += 1
+
+    def _revision(self) -> int:
+        """
+        Returns a value that changes whenever the address book or one of its records changes.
+
+        The counter is shared with all records, so changes to other address books also
+        move it; that only costs an extra rebuild, never a stale view.
+
+        Returns:
+            int: The shared `Record._modifications` counter.
         """
-        if name in self.data:
-            del self.data[name]
+        return Record._modifications
 
-    def _is_date_within_days(self, target_date: datetime, days: int) -> bool:
+    def _cached_render(self, key: tuple) -> Optional[str]:
         """
-        Checks if the target date falls within the given number of days from today.
+        Returns a table rendered earlier for the same key, if the address book
+        has not changed since.
 
         Args:
-            target_date (datetime): The target date to check.
-            days (int): The number of days to check within.
+            key (tuple): The table kind and the values it was rendered for.
 
         Returns:
-            bool: True if the target date is within the range, False otherwise.
+            Optional[str]: The rendered table, or None if it has to be rendered.
         """
-        today_date = datetime.now().date()
-        date_this_year = date(today_date.year, target_date.month, target_date.day)
+        revision = self._revision()
+        if revision != self._render_revision:
+            self._render_cache.clear()
+            self._render_revision = revision
+        return self._render_cache.get(key)
 
-        if date_this_year < today_date:
-            target_date = date(today_date.year + 1, target_date.month, target_date.day)
-        else:
-            target_date = date_this_year
+    def _scan_fields(self, search: tuple) -> List[Record]:
+        """
+        Returns the records with a field value starting with any of the search terms,
+        checking every field of every record.
+
+        Args:
+            search (tuple): The lowercased search terms.
+
+        Returns:
+            List[Record]: The matching records in address book order.
+        """
+        matching_records = []
+        for record in self.values():
+            # Cheapest checks first, so a matching name or address skips the phone and email loops
+            if (
+                record.name._lower.startswith(search)
+                or (record.address and record.address._lower.startswith(search))
+                or (
+                    isinstance(record.birthday, Birthday) and
+                    record.birthday.formatted.startswith(search)
+                )
+                or any(phone._lower.startswith(search) for phone in record.phones)
+                or any(email._lower.startswith(search) for email in record.emails)
+            ):
+                matching_records.append(record)
+
+        return matching_records
+
+    def _next_occurrence(self, today_date: date, month: int, day: int) -> Optional[date]:
+        """
+        Returns the next date, today included, that falls on the given month and day.
 
-        return today_date <= target_date <= (today_date + timedelta(days=days))
+        Args:
+            today_date (date): Today's date.
+            month (int): The month of the anniversary.
+            day (int): The day of the anniversary.
+
+        Returns:
+            Optional[date]: The next occurrence, or None if the month and day do not exist
+                in the year it would fall in (29 February outside leap years).
+        """
+        try:
+            occurrence = date(today_date.year, month, day)
+            if occurrence < today_date:
+                occurrence = date(today_date.year + 1, month, day)
+        except ValueError:
+            return None
+        return occurrence
+
+    def _ensure_birthday_index(self, today_date: date) -> None:
+        """
+        Rebuilds the birthday index if the date or the address book has changed
+        since it was last built.
+
+        The index is a list of (next birthday ordinal, position in the address book, key)
+        tuples sorted by date. Birthdays that do not occur this year or next year
+        (29 February outside leap years) are left out.
+
+        Args:
+            today_date (date): Today's date.
+        """
+        index_key = (today_date, self._revision())
+        if index_key == self._birthday_index_key:
+            return
+
+        entries = []
+        for position, (key, record) in enumerate(self.items()):
+            if not record.birthday:
+                continue
+            user_birthday = record.birthday.value
+            occurrence = self._next_occurrence(today_date, user_birthday.month, user_birthday.day)
+            if occurrence is not None:
+                entries.append((occurrence.toordinal(), position, key))
+
+        entries.sort()
+        self._birthday_index = entries
+        self._birthday_index_key = index_key
 
     def _adjust_to_weekday(self, date_obj: date) -> date:
         """
@@ -229,13 +413,7 @@ class AddressBook(UserDict):
         Returns:
             date: The adjusted date.
         """
-        if date_obj.weekday() == 5:  # Saturday
-            return date_obj + timedelta(days=2)
-
-        if date_obj.weekday() == 6:  # Sunday
-            return date_obj + timedelta(days=1)
-
-        return date_obj
+        return date_obj + _WEEKDAY_SHIFT[date_obj.weekday()]
 
     def get_upcoming_birthdays(self, days: int) -> str:
         """
@@ -249,6 +427,15 @@ class AddressBook(UserDict):
                 with upcoming birthdays, displayed as a table. If no upcoming birthdays are found,
                 returns a message indicating this.
         """
+        today_date = datetime.now().date()
+        console = _get_console()
+        cache_key = ("birthdays", days, today_date, console.width)
+        cached = self._cached_render(cache_key)
+        if cached is not None:
+            return cached
+
+        from rich.table import Table
+
         table = Table(
             title=f"Upcoming Birthdays within {days} Days",
             title_style="bold orange1",
@@ -264,58 +451,66 @@ class AddressBook(UserDict):
         table.add_column("Phones\n", style="green", justify="center", width=16)
         table.add_column("Emails\n", style="green", justify="center", width=30)
 
-        today_date = datetime.now().date()
-        has_birthdays = False
-
-        for record in self.data.values():
-            if record.birthday:
-                try:
-                    user_birthday = record.birthday.value
-
-                    if self._is_date_within_days(user_birthday, days):
-                        month = user_birthday.month
-                        day = user_birthday.day
-                        birthday_this_year = date(today_date.year, month, day)
-
-                        if birthday_this_year < today_date:
-                            congratulation_date = date(today_date.year + 1, month, day)
-                        else:
-                            congratulation_date = birthday_this_year
-
-                        congratulation_date = self._adjust_to_weekday(congratulation_date)
-                        phone_numbers = (
-                            '\n'.join(phone.value for phone in record.phones)
-                            if record.phones
-                            else '---'
-                        )
-                        emails = (
-                            '\n'.join(email.address for email in record.emails)
-                            if record.emails
-                            else '---'
-                        )
-
-                        table.add_row(
-                            record.name.value,
-                            congratulation_date.strftime('%d.%m.%Y'),
-                            phone_numbers,
-                            emails
-                        )
-                        has_birthdays = True
-
-                except ValueError:
-                    pass
-
-        if not has_birthdays:
+        window_end = today_date + timedelta(days=days)
+
+        self._ensure_birthday_index(today_date)
+        index = self._birthday_index
+        start = bisect_left(index, (today_date.toordinal(),))
+        end = bisect_left(index, (window_end.toordinal() + 1,))
+        # Rows are listed in address book order, not by date
+        upcoming = sorted(index[start:end], key=lambda entry: entry[1])
+
+        for ordinal, _, key in upcoming:
+            record = self[key]
+            congratulation_date = self._adjust_to_weekday(date.fromordinal(ordinal))
+            phone_numbers = (
+                record.joined_phones('\n')
+                if record.phones
+                else '---'
+            )
+            emails = (
+                record.joined_emails('\n')
+                if record.emails
+                else '---'
+            )
+
+            table.add_row(
+                record.name.value,
+                congratulation_date.strftime('%d.%m.%Y'),
+                phone_numbers,
+                emails
+            )
+
+        if not upcoming:
             return f"There are no upcoming birthdays within {days} days."
 
-        console = Console()
-        with StringIO() as buf:
-            console.file = buf
-            console.print(table)
-            table_output = buf.getvalue()
+        table_output = _render(console, table)
 
+        self._render_cache[cache_key] = table_output
         return table_output
 
+    def _contact_row(self, record: Record) -> tuple:
+        """
+        Builds the table cells of a contact for the contact detail and contact list tables.
+
+        Args:
+            record (Record): The contact record to display.
+
+        Returns:
+            tuple: The name, phones, emails, address and birthday cells, with '---' for
+                missing values.
+        """
+        phone_numbers = (
+            record.joined_phones('\n')
+            if record.phones
+            else '---'
+        )
+        emails = record.joined_emails('\n') if record.emails else '---'
+        address = record.get_address() or '---'
+        birthday = record.birthday.formatted if record.birthday else '---'
+
+        return (record.name.value, phone_numbers, emails, address, birthday)
+
     def show_single_contact(self, record: Record) -> str:
         """
         Returns a formatted string of a single contact in the address book.
@@ -323,47 +518,30 @@ class AddressBook(UserDict):
         Args:
             record (Record): The contact record to be displayed.
 
+        The rendered table is cached per record and reused until the record changes.
+
         Returns:
             str: A formatted string containing the contact information displayed as a table.
         """
-        table = Table(
-            title="Contact Details",
-            title_style="bold orange1",
-            border_style="gray50",
-            padding=(0, 2),
-            show_header=True,
-            show_lines=True,
-            header_style="bold cyan"
-        )
+        console = _get_console()
+        cached = self._contact_cache.get(id(record))
+        if (
+            cached is not None
+            and cached[0] is record
+            and cached[1] == record._version
+            and cached[2] == console.width
+        ):
+            return cached[3]
 
-        table.add_column("Name\n", style="dark_orange", width=20)
-        table.add_column("Phones\n", style="green", justify="center", width=16)
-        table.add_column("Emails\n", style="green", justify="center", width=30)
-        table.add_column("Address\n", style="green", justify="center")
-        table.add_column("Birthday\n", style="green", justify="center", width=16)
+        table = _make_contacts_table("Contact Details")
 
-        phone_numbers = (
-            '\n'.join(phone.value for phone in record.phones)
-            if record.phones
-            else '---'
-        )
-        emails = '\n'.join(email.address for email in record.emails) if record.emails else '---'
-        address = record.get_address() if record.get_address() else '---'
-        birthday = record.birthday.value.strftime('%d.%m.%Y') if record.birthday else '---'
-
-        table.add_row(
-            record.name.value,
-            phone_numbers,
-            emails,
-            address,
-            birthday
-        )
+        table.add_row(*self._contact_row(record))
 
-        console = Console()
-        with StringIO() as buf:
-            console.file = buf
-            console.print(table)
-            table_output = buf.getvalue()
+        table_output = _render(console, table)
+
+        if len(self._contact_cache) >= _CONTACT_CACHE_SIZE:
+            self._contact_cache.clear()
+        self._contact_cache[id(record)] = (record, record._version, console.width, table_output)
 
         return table_output
 
@@ -375,51 +553,97 @@ class AddressBook(UserDict):
             str: A formatted string containing all contacts in the address book,
                 displayed as a table.
         """
-        if not self.data:
+        if not self:
             return "No contacts found."
 
-        table = Table(
-            title="All Contacts",
-            title_style="bold orange1",
-            border_style="gray50",
-            padding=(0, 2),
-            show_header=True,
-            show_lines=True,
-            header_style="bold cyan"
-        )
-
-        table.add_column("Name\n", style="dark_orange", width=20)
-        table.add_column("Phones\n", style="green", justify="center", width=16)
-        table.add_column("Emails\n", style="green", justify="center", width=30)
-        table.add_column("Address\n", style="green", justify="center")
-        table.add_column("Birthday\n", style="green", justify="center", width=16)
+        console = _get_console()
+        cache_key = ("all", console.width)
+        cached = self._cached_render(cache_key)
+        if cached is not None:
+            return cached
 
-        for record in self.data.values():
-            phone_numbers = (
-                '\n'.join(phone.value for phone in record.phones)
-                if record.phones
-                else '---'
-            )
-            emails = '\n'.join(email.address for email in record.emails) if record.emails else '---'
-            address = record.get_address() if record.get_address() else '---'
-            birthday = record.birthday.value.strftime('%d.%m.%Y') if record.birthday else '---'
+        table = _make_contacts_table("All Contacts")
 
-            table.add_row(
-                record.name.value,
-                phone_numbers,
-                emails,
-                address,
-                birthday
-            )
+        for record in self.values():
+            table.add_row(*self._contact_row(record))
 
-        console = Console()
-        with StringIO() as buf:
-            console.file = buf
-            console.print(table)
-            table_output = buf.getvalue()
+        table_output = _render(console, table)
 
+        self._render_cache[cache_key] = table_output
         return table_output
 
+    def to_dict(self) -> dict:
+        """
+        Converts the address book to a dict of plain, serializable values.
+
+        Returns:
+            dict: A dict with a "records" list holding `Record.to_dict()` of every contact.
+        """
+        return {"records": [record.to_dict() for record in self.values()]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AddressBook":
+        """
+        Creates an address book from a dict produced by `to_dict`.
+
+        Args:
+            data (dict): The plain address book values.
+
+        Returns:
+            AddressBook: The restored address book.
+        """
+        book = cls()
+        for record_data in data["records"]:
+            book.add_record(Record.from_dict(record_data))
+        return book
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the address book as a call to the class plus its compact state.
+
+        Without this, pickle would also store every record as a dict item next to
+        the `__getstate__` rows.
+
+        Returns:
+            tuple: The class, no constructor arguments and the `__getstate__` rows.
+        """
+        return (self.__class__, (), self.__getstate__())
+
+    def __getstate__(self) -> list:
+        """
+        Returns the compact pickle state of the address book.
+
+        Each record is stored as a tuple of plain values in `_STATE_FIELDS` order
+        instead of pickling the Record, Name, Phone, ... objects and their attribute dicts.
+
+        Returns:
+            list: A list of (name, phones, emails, address, birthday) tuples.
+        """
+        rows = []
+        for record in self.values():
+            record_data = record.to_dict()
+            rows.append(tuple(record_data[field] for field in _STATE_FIELDS))
+        return rows
+
+    def __setstate__(self, state) -> None:
+        """
+        Rebuilds the address book from a pickle state.
+
+        Args:
+            state (list | dict): The rows returned by `__getstate__`, or the attribute
+                dict of an address book pickled before the compact state was introduced.
+        """
+        if isinstance(state, dict):
+            # Older books hold Record objects created by older code, so they are rebuilt
+            # to pick up attributes added since
+            records_data = [record.to_dict() for record in state["data"].values()]
+        else:
+            records_data = [dict(zip(_STATE_FIELDS, row)) for row in state]
+
+        self.__init__()
+        for record_data in records_data:
+            self.add_record(Record.from_dict(record_data))
+
     def __str__(self) -> str:
         """
         Returns a string representation of all records in the address book.
@@ -427,4 +651,4 @@ class AddressBook(UserDict):
         Returns:
             str: A string representing all records in the address book.
         """
-        return "\n".join(str(record) for record in self.data.values())
+        return "\n".join(str(record) for record in self.values())
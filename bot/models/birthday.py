@@ -15,8 +15,44 @@ represents a valid date in the past.
 """
 
 from datetime import datetime
+from typing import Tuple
 from .field import Field
 
+def _parse_date(value: str) -> Tuple[datetime, bool]:
+    """
+    Parse a DD.MM.YYYY date string.
+
+    Strict two-digit day and month values are split and converted directly;
+    anything else goes through datetime.strptime so that it is accepted or
+    rejected exactly as before.
+
+    Parameters:
+    value (str): The date string.
+
+    Returns:
+    tuple: The parsed date, and whether the string is already what
+    strftime("%d.%m.%Y") returns for it.
+
+    Raises:
+    ValueError: If the string is not a valid date in the expected format.
+    """
+    if (
+        len(value) == 10
+        and value.isascii()
+        and value[2] == "."
+        and value[5] == "."
+        and value[:2].isdigit()
+        and value[3:5].isdigit()
+        and value[6:].isdigit()
+    ):
+        day = int(value[:2])
+        month = int(value[3:5])
+        if 1 <= day <= 31 and 1 <= month <= 12:
+            year = int(value[6:])
+            # strftime does not zero-pad years below 1000
+            return datetime(year, month, day), year >= 1000
+    return datetime.strptime(value, "%d.%m.%Y"), False
+
 class Birthday(Field):
     """
     Represents a birthday field in a contact management system.
@@ -27,6 +63,7 @@ class Birthday(Field):
 
     Attributes:
     value (datetime): The birthday date stored as a datetime object.
+    formatted (str): The birthday date as a DD.MM.YYYY string, computed once.
 
     Parameters:
     value (str): A string representing the birthday date in the format DD.MM.YYYY.
@@ -35,6 +72,8 @@ class Birthday(Field):
     ValueError: If the date format is incorrect or if the date is in the future.
     """
 
+    __slots__ = ("_formatted",)
+
     def __init__(self, value: str) -> None:
         """
         Initialize a Birthday object with the provided date string.
@@ -46,12 +85,66 @@ class Birthday(Field):
         ValueError: If the date format is incorrect or if the date is in the future.
         """
         try:
-            birthday_date = datetime.strptime(value, "%d.%m.%Y")
+            birthday_date, is_formatted = _parse_date(value)
             if birthday_date > datetime.now():
                 raise ValueError("Birthday date cannot be in the future")
-            self.value = birthday_date
         except ValueError as exc:
             if "unconverted data remains" in str(exc) or "does not match format" in str(exc):
                 raise ValueError("Invalid date format. Use DD.MM.YYYY") from exc
             raise
         super().__init__(birthday_date)
+        if is_formatted:
+            # Strings in the canonical form are their own formatted date
+            self._formatted = value
+
+    def __setattr__(self, name, value) -> None:
+        """
+        Sets an attribute, dropping the cached formatted date when the value changes.
+        """
+        if name == "value":
+            super().__setattr__("_formatted", None)
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state) -> None:
+        """
+        Restore a pickled birthday.
+
+        Parameters:
+        state: The pickled attributes. A formatted date cached by an older
+        version is dropped and computed again on first use.
+        """
+        if isinstance(state, dict):
+            state = {name: value for name, value in state.items() if name != "formatted"}
+        super().__setstate__(state)
+
+    @classmethod
+    def _restore(cls, value) -> "Birthday":
+        """
+        Create a birthday from a saved date without validating it again.
+
+        Parameters:
+        value (int | str): The date ordinal stored by `Record.to_dict`, or a
+        D.M.Y string stored by earlier versions, whose years below 1000 are
+        not zero-padded.
+
+        Returns:
+        Birthday: The restored birthday.
+        """
+        if isinstance(value, str):
+            day, month, year = map(int, value.split("."))
+            birthday_date = datetime(year, month, day)
+        else:
+            birthday_date = datetime.fromordinal(value)
+        return super()._restore(birthday_date)
+
+    @property
+    def formatted(self) -> str:
+        """
+        Return the birthday date formatted as DD.MM.YYYY.
+
+        Returns:
+        str: The formatted date, cached until the value is reassigned.
+        """
+        if self._formatted is None:
+            self._formatted = self.value.strftime("%d.%m.%Y")
+        return self._formatted
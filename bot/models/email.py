@@ -11,6 +11,9 @@ Example usage:
 import re
 from .field import Field
 
+# Compiled once at import instead of being looked up in the re cache per email
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+')
+
 class Email(Field):
     """
     A class representing an email address with validation.
@@ -26,6 +29,8 @@ class Email(Field):
             Initializes a new Email instance with validation.
     """
 
+    __slots__ = ("address",)
+
     def __init__(self, address: str) -> None:
         """
         Initializes a new Email instance with a given value, ensuring it is a valid email address.
@@ -36,10 +41,22 @@ class Email(Field):
         Raises:
             ValueError: If the email address does not match the pattern.
         """
+        if not _EMAIL_RE.fullmatch(address):
+            raise ValueError("Invalid email format. Expected format: example@domain.com")
         super().__init__(address)
         self.address = address
 
-        email_pattern = r'[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+'
+    @classmethod
+    def _restore(cls, address: str) -> "Email":
+        """
+        Creates an email from an address that was validated before it was saved.
+
+        Args:
+            address (str): The saved email address.
 
-        if not re.fullmatch(email_pattern, address):
-            raise ValueError("Invalid email format. Expected format: example@domain.com")
+        Returns:
+            Email: The restored email, created without matching the pattern again.
+        """
+        email = super()._restore(address)
+        email.address = address
+        return email
@@ -15,12 +15,26 @@ class Field:
 
     Attributes:
         value (Any): The value stored in the field.
+        _lower (str | None): The lowercased value used by search, or None for non-string values.
 
     Methods:
         __str__() -> str:
             Returns a string representation of the field's value.
+
+        _restore(value: Any) -> Field:
+            Creates a field from a saved value without validating it again.
+
+        __getstate__() -> dict:
+            Returns the slot values of the field for pickling.
+
+        __setstate__(state: dict) -> None:
+            Restores a pickled field, including fields pickled before they had slots.
     """
 
+    # Fields are created for every phone, email and address, so they keep their
+    # attributes in slots instead of a per-instance __dict__
+    __slots__ = ("value", "_lower")
+
     def __init__(self, value: Any) -> None:
         """
         Initializes a new Field instance with a given value.
@@ -29,6 +43,23 @@ class Field:
             value (Any): The value to be stored in the field.
         """
         self.value = value
+        # Lowercased once for case-insensitive search
+        self._lower = value.lower() if isinstance(value, str) else None
+
+    @classmethod
+    def _restore(cls, value: Any) -> "Field":
+        """
+        Creates a field from a value that was validated before it was saved.
+
+        Args:
+            value (Any): The saved value.
+
+        Returns:
+            Field: The restored field, created without running the subclass checks.
+        """
+        field = cls.__new__(cls)
+        Field.__init__(field, value)
+        return field
 
     def __str__(self) -> str:
         """
@@ -38,3 +69,31 @@ class Field:
             str: The string representation of the field's value.
         """
         return str(self.value)
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the attributes of the field for pickling.
+
+        Returns:
+            dict: The set slot values of the field and its subclass, by name.
+        """
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores the attributes of a pickled field.
+
+        Args:
+            state (dict): The pickled attributes, from `__getstate__` or from the
+                `__dict__` of a field pickled before slots were added. The lowercased
+                value is computed when the state does not include it.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
+        if "_lower" not in state:
+            self._lower = self.value.lower() if isinstance(self.value, str) else None
@@ -32,6 +32,8 @@ class Name(Field):
     - __init__: Initializes the Name instance and ensures the name is not empty.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initializes the Name instance with a value.
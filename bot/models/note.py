@@ -13,9 +13,12 @@ Example usage:
     print(note)
 """
 
+import sys
 import uuid
 from datetime import datetime
-from typing import List
+from typing import List, Set
+
+_CREATE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 class Note:
     """
@@ -28,10 +31,15 @@ class Note:
     Attributes:
     - id (str): A unique identifier for the note.
     - create_date (datetime): The date and time when the note was created.
+    - _create_date_str (str): The creation date as shown in note listings, formatted once.
     - text (str): The content of the note.
     - tags (List[str]): A list of tags associated with the note.
+    - _tag_set (Set[str]): The same tags as a set, used for membership checks.
     """
 
+    # Notebooks can hold many notes, so their attributes live in slots instead of a __dict__
+    __slots__ = ("id", "create_date", "_create_date_str", "text", "tags", "_tag_set")
+
     def __init__(self, text, tags: List[str] = None):
         """
         Initializes a new Note instance.
@@ -40,19 +48,49 @@ class Note:
         - text (str): The content of the note.
         - tags (List[str], optional): A list of tags associated with the note. Defaults to None.
         """
-        self.id = str(uuid.uuid4())
+        # The hex form skips formatting the hyphenated string; stored IDs keep their old form
+        self.id = uuid.uuid4().hex
         self.create_date = datetime.now()
+        self._create_date_str = self.create_date.strftime(_CREATE_DATE_FORMAT)
         self.text = text
-        self.tags = tags if tags else []
+        self.tags = [sys.intern(tag) for tag in tags] if tags else []
+        self._tag_set: Set[str] = set(self.tags)
+
+    @classmethod
+    def restore(cls, note_id: str, create_date: datetime, text: str, tags: List[str]) -> "Note":
+        """
+        Recreates a saved note, keeping its original ID and creation date.
+
+        Args:
+        - note_id (str): The unique identifier of the note.
+        - create_date (datetime): The date and time when the note was created.
+        - text (str): The content of the note.
+        - tags (List[str]): A list of tags associated with the note.
+
+        Returns:
+        - Note: The restored note.
+        """
+        note = cls.__new__(cls)
+        note.id = note_id
+        note.create_date = create_date
+        note._create_date_str = create_date.strftime(_CREATE_DATE_FORMAT)
+        note.text = text
+        note.tags = [sys.intern(tag) for tag in tags]
+        note._tag_set = set(note.tags)
+        return note
 
     def add_tag(self, tag):
         """
         Adds a tag to the note if it is not already present.
 
+        Tags are interned, so the same tag on many notes is stored once.
+
         Args:
         - tag (str): The tag to be added.
         """
-        if tag not in self.tags:
+        if tag not in self._tag_set:
+            tag = sys.intern(tag)
+            self._tag_set.add(tag)
             self.tags.append(tag)
 
     def remove_tag(self, tag):
@@ -62,9 +100,37 @@ class Note:
         Args:
         - tag (str): The tag to be removed.
         """
-        if tag in self.tags:
+        if tag in self._tag_set:
+            self._tag_set.discard(tag)
             self.tags.remove(tag)
 
+    def __getstate__(self) -> dict:
+        """
+        Returns the attributes of the note for pickling.
+
+        Returns:
+        - dict: The stored note attributes, without the ones derived from them.
+        """
+        return {
+            "id": self.id,
+            "create_date": self.create_date,
+            "text": self.text,
+            "tags": self.tags,
+        }
+
+    def __setstate__(self, state: dict):
+        """
+        Restores a pickled note and rebuilds its tag set and formatted creation date.
+
+        Args:
+        - state (dict): The pickled attributes, from `__getstate__` or from the
+        `__dict__` of a note pickled before slots were added.
+        """
+        for name in ("id", "create_date", "text", "tags"):
+            setattr(self, name, state[name])
+        self._tag_set = set(self.tags)
+        self._create_date_str = self.create_date.strftime(_CREATE_DATE_FORMAT)
+
     def __str__(self):
         """
         Returns a string representation of the note.
@@ -72,7 +138,7 @@ class Note:
         Returns:
         - str: A string representation of the note.
         """
-        s = f"{self.id} | {self.create_date.strftime('%Y-%m-%d %H:%M:%S')} | {self.text}"
+        s = f"{self.id} | {self._create_date_str} | {self.text}"
         if self.tags:
             s += f" ({', '.join(self.tags)})"
         return s
@@ -2,7 +2,7 @@
 This module provides a NoteBook class to manage a collection of notes with text and optional tags.
 
 Classes:
-- NoteBook: A dictionary-like collection to store and manage Note objects.
+- NoteBook: A dict subclass to store and manage Note objects.
 
 Example usage:
     notebook = NoteBook()
@@ -14,21 +14,61 @@ Example usage:
     print(notebook)
 """
 
-from collections import UserDict
-from typing import List
-from io import StringIO
-
-from rich.table import Table
-from rich.console import Console
+from collections import defaultdict
+from operator import attrgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
 
 from .note import Note
 
-class NoteBook(UserDict):
+# Rich is imported on first render, so loading the models does not pay for it
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Console shared by all notebooks, created on first use
+_console = None
+
+# Sort keys for note lists; sorted() calls the key once per note, so C-level
+# attribute getters are all there is to save over lambdas
+_BY_TAGS = attrgetter("tags")
+_BY_DATE = attrgetter("create_date")
+_TAGS_THEN_DATE = attrgetter("tags", "create_date")
+
+def _get_console() -> "Console":
+    """
+    Returns the shared Rich console, creating it on first use.
+
+    Returns:
+    - Console: The console used to render the note tables.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def _normalize_tags(tags: List[str]) -> Tuple[str, ...]:
+    """
+    Returns the tags with a '#' prefix, dropping repeats.
+
+    Args:
+    - tags (List[str]): The tags as given by the user.
+
+    Returns:
+    - Tuple[str, ...]: The distinct tags, each containing a '#', in the order given.
+    """
+    return tuple(dict.fromkeys(tag if "#" in tag else f"#{tag}" for tag in tags))
+
+class NoteBook(dict):
     """
     A dictionary-like collection to store and manage Note objects.
 
+    Attributes:
+    - _by_tag (Dict[str, Set[str]]): The IDs of the notes carrying each tag.
+
     Methods:
+    - data: Returns the notebook itself, for code written against the former UserDict base.
     - add_note: Adds a new note to the notebook.
+    - _bulk_load: Adds many notes to the notebook at once.
     - change_note: Changes the text of an existing note.
     - delete_note: Deletes a note from the notebook.
     - search_notes: Searches for notes by keyword or tag.
@@ -37,9 +77,58 @@ class NoteBook(UserDict):
     - search_by_tag: Searches for notes by a specific tag.
     - sort_by_tag: Sorts notes by their tags.
     - notes_to_table: Converts notes to a formatted table string.
+    - __reduce__: Pickles the notebook through its compact state only.
+    - __getstate__: Returns the compact pickle state of the notebook.
+    - __setstate__: Rebuilds the notebook from a pickle state.
     - __str__: Returns a string representation of all notes.
     """
 
+    def __init__(self, *args, **kwargs):
+        """
+        Initializes the notebook and its tag index.
+        """
+        self._by_tag: Dict[str, Set[str]] = defaultdict(set)
+        super().__init__(*args, **kwargs)
+        for note in self.values():
+            self._index_note(note)
+
+    def _index_note(self, note: Note):
+        """
+        Registers the tags of a note in the tag index.
+
+        Args:
+        - note (Note): The note to register.
+        """
+        for tag in note.tags:
+            self._by_tag[tag].add(note.id)
+
+    def _unindex_tag(self, note_id: str, tag: str):
+        """
+        Removes a note from the tag index entry of one tag.
+
+        Args:
+        - note_id (str): The ID of the note.
+        - tag (str): The tag the note no longer carries.
+        """
+        note_ids = self._by_tag.get(tag)
+        if note_ids is not None:
+            note_ids.discard(note_id)
+            if not note_ids:
+                del self._by_tag[tag]
+
+    @property
+    def data(self) -> "NoteBook":
+        """
+        Returns the notebook itself.
+
+        The notebook used to be a UserDict keeping its notes in `data`; it is now
+        a dict subclass, and this keeps `note_book.data` working.
+
+        Returns:
+        - NoteBook: This notebook.
+        """
+        return self
+
     def add_note(self, note: Note):
         """
         Adds a new note to the notebook.
@@ -47,7 +136,22 @@ class NoteBook(UserDict):
         Args:
         - note (Note): The note to be added.
         """
-        self.data[note.id] = note
+        self[note.id] = note
+        self._index_note(note)
+
+    def _bulk_load(self, notes: Iterable[Note]):
+        """
+        Adds many notes to the notebook at once, as when loading a saved notebook.
+
+        The notes are inserted with a single dict update and then indexed.
+
+        Args:
+        - notes (Iterable[Note]): The notes to be added.
+        """
+        notes = list(notes)
+        self.update([(note.id, note) for note in notes])
+        for note in notes:
+            self._index_note(note)
 
     def change_note(self, index, new_text):
         """
@@ -57,7 +161,7 @@ class NoteBook(UserDict):
         - index (str): The ID of the note to be changed.
         - new_text (str): The new text for the note.
         """
-        self.data[index].text = new_text
+        self[index].text = new_text
 
     def delete_note(self, index):
         """
@@ -66,7 +170,9 @@ class NoteBook(UserDict):
         Args:
         - index (str): The ID of the note to be deleted.
         """
-        del self.data[index]
+        note = self.pop(index)
+        for tag in note.tags:
+            self._unindex_tag(index, tag)
 
     def search_notes(self, keyword):
         """
@@ -85,20 +191,28 @@ class NoteBook(UserDict):
                 "Usage by tags: search-note #<tag> [#<tag2> ... #<tagN>]"
             )
 
-        if not self.data:
+        if not self:
             return "No notes found."
 
         data = []
 
         if "#" in keyword:
             keys = [k for k in keyword.split(" ") if "#" in k]
-            data = [note for note in self.data.values() if any(key in note.tags for key in keys)]
-            data = sorted(data, key=lambda note: note.tags)
+            # Repeated tags in the query are looked up once
+            note_ids = set().union(*(self._by_tag.get(key, ()) for key in frozenset(keys)))
+            # Creation date keeps notes with equal tags in the order they were added
+            data = sorted(
+                (self[note_id] for note_id in note_ids),
+                key=_TAGS_THEN_DATE
+            )
             if not data:
                 return "No notes found."
             return self.notes_to_table(f"Found Notes by Tag '{' '.join(keys)}'", data)
 
-        data = [note for note in self.data.values() if keyword in note.text]
+        # The substring test stays on CPython's str `in`, which already uses a fast
+        # search algorithm; JIT compilers such as Numba handle Python strings poorly
+        # and would add dispatch overhead.
+        data = [note for note in self.values() if keyword in note.text]
         if not data:
             return "No notes found."
         return self.notes_to_table(f"Found Notes by Keyword '{keyword}'", data)
@@ -107,33 +221,39 @@ class NoteBook(UserDict):
         """
         Adds tags to a note.
 
+        Tags without a '#' get one, so 'work' and '#work' are the same tag.
+
         Args:
         - note_id (str): The ID of the note.
         - tags (List[str]): A list of tags to be added.
         """
-        note = self.data[note_id]
-        for tag in tags:
-            if tag in note.tags:
-                continue
-            if "#" not in tag:
-                tag = f"#{tag}"
-            note.tags.append(tag)
+        note = self[note_id]
+        for tag in _normalize_tags(tags):
+            if tag not in note._tag_set:
+                note.add_tag(tag)
+                self._by_tag[tag].add(note_id)
 
     def delete_tag(self, note_id: str, tags: List[str]):
         """
         Deletes tags from a note.
 
+        Tags without a '#' get one, so 'work' and '#work' are the same tag.
+
         Args:
         - note_id (str): The ID of the note.
         - tags (List[str]): A list of tags to be deleted.
+
+        Raises:
+        - ValueError: If the note does not have one of the tags. No tag is deleted then.
         """
-        note = self.data[note_id]
-        for tag in tags:
-            if tag in note.tags:
-                continue
-            if "#" not in tag:
-                tag = f"#{tag}"
-            note.tags.remove(tag)
+        note = self[note_id]
+        normalized = _normalize_tags(tags)
+        missing = [tag for tag in normalized if tag not in note._tag_set]
+        if missing:
+            raise ValueError(f"Tag not found: {', '.join(missing)}")
+        for tag in normalized:
+            note.remove_tag(tag)
+            self._unindex_tag(note_id, tag)
 
     def search_by_tag(self, tag):
         """
@@ -145,7 +265,8 @@ class NoteBook(UserDict):
         Returns:
         - List[Note]: A list of notes that contain the tag.
         """
-        return [note for note in self.data.values() if tag in note.tags]
+        notes = (self[note_id] for note_id in self._by_tag.get(tag, ()))
+        return sorted(notes, key=_BY_DATE)
 
     def sort_by_tag(self):
         """
@@ -154,7 +275,7 @@ class NoteBook(UserDict):
         Returns:
         - List[Note]: A list of notes sorted by their tags.
         """
-        return sorted(self.data.values(), key=lambda note: note.tags)
+        return sorted(self.values(), key=_BY_TAGS)
 
     def notes_to_table(self, title: str, notes: List[Note]) -> str:
         """
@@ -167,6 +288,8 @@ class NoteBook(UserDict):
         Returns:
         - str: A formatted table string of the notes.
         """
+        from rich.table import Table
+
         table = Table(
             title=f"{title}",
             title_style="bold orange1",
@@ -184,16 +307,57 @@ class NoteBook(UserDict):
         for n in notes:
             table.add_row(
                 str(n.id),
-                n.create_date.strftime("%Y-%m-%d %H:%M:%S"),
+                n._create_date_str,
                 str(n.text),
                 " ".join(n.tags)
             )
-        console = Console()
-        with StringIO() as buf:
-            console.file = buf
+        console = _get_console()
+        with console.capture() as capture:
             console.print(table)
-            table_output = buf.getvalue()
-        return table_output
+        return capture.get()
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the notebook as a call to the class plus its compact state.
+
+        Without this, pickle would also store every note as a dict item next to
+        the `__getstate__` rows.
+
+        Returns:
+        - tuple: The class, no constructor arguments and the `__getstate__` rows.
+        """
+        return (self.__class__, (), self.__getstate__())
+
+    def __getstate__(self) -> list:
+        """
+        Returns the compact pickle state of the notebook.
+
+        Each note is stored as a tuple of plain values instead of pickling the Note
+        objects and their attribute dicts.
+
+        Returns:
+        - list: A list of (id, create_date, text, tags) tuples.
+        """
+        return [(n.id, n.create_date, n.text, n.tags) for n in self.values()]
+
+    def __setstate__(self, state) -> None:
+        """
+        Rebuilds the notebook from a pickle state.
+
+        Args:
+        - state (list | dict): The rows returned by `__getstate__`, or the attribute dict
+        of a notebook pickled before the compact state was introduced.
+        """
+        self.__init__()
+        if isinstance(state, dict):
+            # The notes of a UserDict-based notebook were kept in its `data` attribute
+            self._bulk_load(state["data"].values())
+            return
+
+        self._bulk_load(
+            Note.restore(note_id, create_date, text, tags)
+            for note_id, create_date, text, tags in state
+        )
 
     def __str__(self) -> str:
         """
@@ -202,6 +366,6 @@ class NoteBook(UserDict):
         Returns:
         - str: A formatted table string of all notes or a message if no notes are found.
         """
-        if not self.data:
+        if not self:
             return "No notes."
-        return self.notes_to_table("All Notes", [note for note in self.data.values()])
+        return self.notes_to_table("All Notes", [note for note in self.values()])
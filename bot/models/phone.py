@@ -7,7 +7,6 @@ Classes:
 Usage:
 - The Phone class inherits from Field and validates that the phone number is exactly 10 digits long.
 """
-import re
 from .field import Field
 
 class Phone(Field):
@@ -25,6 +24,8 @@ class Phone(Field):
             Initializes a new Phone instance with validation.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str) -> None:
         """
         Initializes a new Phone instance with a given value, ensuring it is a valid phone number.
@@ -35,6 +36,7 @@ class Phone(Field):
         Raises:
             ValueError: If the phone number does not consist of exactly 10 digits.
         """
-        if not re.fullmatch(r'\d{10}', value):
+        # isdecimal() accepts the same digits as the regex \d; isdigit() would also accept superscripts
+        if not (len(value) == 10 and value.isdecimal()):
             raise ValueError("Phone number must be 10 digits")
         super().__init__(value)
@@ -7,7 +7,7 @@ Classes:
 - Record: Represents a contact record with a name and a list of phone numbers.
 """
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .name import Name
 from .phone import Phone
@@ -23,8 +23,20 @@ class Record:
     - name (Name): The contact's name.
     - phones (List[Phone]): A list of the contact's phone numbers.
     - emails (List[Email]): A list of the contact's email addresses.
+    - _version (int): A counter bumped on every change, used to invalidate cached views.
+    - _joined (Dict[tuple, str]): Joined phone and email strings, cleared on every change.
+
+    Class attributes:
+    - _modifications (int): A counter shared by all records, bumped on every record change
+    and by `AddressBook.add_record`/`delete`, so an address book can tell with a single
+    comparison whether its cached views are stale.
     """
 
+    _modifications = 0
+
+    # One record exists per contact, so its attributes live in slots instead of a __dict__
+    __slots__ = ("name", "phones", "emails", "birthday", "address", "_version", "_joined")
+
     def __init__(self, name: str) -> None:
         """
         Initializes a new Record instance with a name.
@@ -37,6 +49,18 @@ class Record:
         self.emails: List[Email] = []
         self.birthday = None
         self.address = None
+        self._version = 0
+        self._joined: Dict[tuple, str] = {}
+
+#------------------------------------------------------------------
+
+    def _touch(self) -> None:
+        """
+        Marks the contact record as changed so cached views of it are rebuilt.
+        """
+        self._version += 1
+        Record._modifications += 1
+        self._joined.clear()
 
 #------------------------------------------------------------------
 
@@ -54,6 +78,24 @@ class Record:
 
         email = Email(email_address)
         self.emails.append(email)
+        self._touch()
+
+#------------------------------------------------------------------
+
+    def extend_emails(self, email_addresses: Iterable[str]) -> None:
+        """
+        Adds several email addresses to the contact's list of emails in one step.
+
+        All addresses are validated before any is added, and cached views of the
+        record are invalidated once.
+
+        Args:
+        - email_addresses (Iterable[str]): The email addresses to add.
+        """
+        emails = [Email(email_address) for email_address in email_addresses]
+        if emails:
+            self.emails.extend(emails)
+            self._touch()
 
 #------------------------------------------------------------------
 
@@ -67,7 +109,11 @@ class Record:
         Returns:
         - None
         """
-        self.emails = [e for e in self.emails if e.address != email_address]
+        count = len(self.emails)
+        # Filtered in place, so code holding the list sees the removal
+        self.emails[:] = [email for email in self.emails if email.address != email_address]
+        if len(self.emails) != count:
+            self._touch()
 
 #------------------------------------------------------------------
 
@@ -75,12 +121,27 @@ class Record:
         """
         Replaces an old email address with a new one in the contact's list of emails.
 
+        The new address takes the place of the old one. If the old address is not in
+        the list, the new one is added at the end.
+
         Args:
         - old_email (str): The email address to replace.
         - new_email (str): The new email address to add.
         """
-        self.add_email(new_email)
-        self.remove_email(old_email)
+        email = Email(new_email)
+        for i, current in enumerate(self.emails):
+            if current.address == old_email:
+                self.emails[i] = email
+                break
+        else:
+            self.emails.append(email)
+            self._touch()
+            return
+        # Drop any further copies of the old address
+        for j in range(len(self.emails) - 1, i, -1):
+            if self.emails[j].address == old_email:
+                del self.emails[j]
+        self._touch()
 
 #------------------------------------------------------------------
 
@@ -92,6 +153,7 @@ class Record:
         - address_str (str): The address to set.
         """
         self.address = Address(address_str)
+        self._touch()
 
 #------------------------------------------------------------------
 
@@ -103,6 +165,7 @@ class Record:
         - new_address_str (str): The new address to set.
         """
         self.address = Address(new_address_str)
+        self._touch()
 
 #------------------------------------------------------------------
 
@@ -126,6 +189,24 @@ class Record:
         """
         phone = Phone(phone_number)
         self.phones.append(phone)
+        self._touch()
+
+#------------------------------------------------------------------
+
+    def extend_phones(self, phone_numbers: Iterable[str]) -> None:
+        """
+        Adds several phone numbers to the contact's list of phone numbers in one step.
+
+        All numbers are validated before any is added, and cached views of the
+        record are invalidated once.
+
+        Args:
+        - phone_numbers (Iterable[str]): The phone numbers to add.
+        """
+        phones = [Phone(phone_number) for phone_number in phone_numbers]
+        if phones:
+            self.phones.extend(phones)
+            self._touch()
 
 #------------------------------------------------------------------
 
@@ -136,7 +217,11 @@ class Record:
         Args:
         - phone_number (str): The phone number to remove.
         """
-        self.phones = [p for p in self.phones if p.value != phone_number]
+        count = len(self.phones)
+        # Filtered in place, so code holding the list sees the removal
+        self.phones[:] = [phone for phone in self.phones if phone.value != phone_number]
+        if len(self.phones) != count:
+            self._touch()
 
 #------------------------------------------------------------------
 
@@ -144,13 +229,27 @@ class Record:
         """
         Replaces an old phone number with a new phone number in the contact's list.
 
+        The new number takes the place of the old one. If the old number is not in
+        the list, the new one is added at the end.
+
         Args:
         - old_phone_number (str): The phone number to replace.
         - new_phone_number (str): The new phone number to add.
         """
-
-        self.add_phone(new_phone_number)
-        self.remove_phone(old_phone_number)
+        phone = Phone(new_phone_number)
+        for i, current in enumerate(self.phones):
+            if current.value == old_phone_number:
+                self.phones[i] = phone
+                break
+        else:
+            self.phones.append(phone)
+            self._touch()
+            return
+        # Drop any further copies of the old number
+        for j in range(len(self.phones) - 1, i, -1):
+            if self.phones[j].value == old_phone_number:
+                del self.phones[j]
+        self._touch()
 
 #------------------------------------------------------------------
 
@@ -161,9 +260,47 @@ class Record:
         Returns:
         - str: A string in the format 'name: phone1, phone2, ...'.
         """
-        phones = ", ".join(f"[cyan]{phone.value}[/cyan]" for phone in self.phones)
+        phones = ", ".join([f"[cyan]{phone.value}[/cyan]" for phone in self.phones])
         return f"[dark_orange]{self.name.value}:[/dark_orange] {phones}"
 
+#------------------------------------------------------------------
+
+    def joined_phones(self, separator: str) -> str:
+        """
+        Returns the contact's phone numbers joined with a separator.
+
+        The result is kept until the record changes.
+
+        Args:
+        - separator (str): The string to put between the phone numbers.
+
+        Returns:
+        - str: The joined phone numbers, or an empty string if there are none.
+        """
+        key = ("phones", separator)
+        if key not in self._joined:
+            self._joined[key] = separator.join(phone.value for phone in self.phones)
+        return self._joined[key]
+
+#------------------------------------------------------------------
+
+    def joined_emails(self, separator: str) -> str:
+        """
+        Returns the contact's email addresses joined with a separator.
+
+        The result is kept until the record changes.
+
+        Args:
+        - separator (str): The string to put between the email addresses.
+
+        Returns:
+        - str: The joined email addresses, or an empty string if there are none.
+        """
+        key = ("emails", separator)
+        if key not in self._joined:
+            self._joined[key] = separator.join(email.address for email in self.emails)
+        return self._joined[key]
+
 #------------------------------------------------------------------
 
     def add_birthday(self, birthday: str) -> None:
@@ -175,6 +312,7 @@ class Record:
         """
         if self.birthday is None:
             self.birthday = Birthday(birthday)
+            self._touch()
         else:
             raise ValueError("Birthday is already set")
 
@@ -189,7 +327,7 @@ class Record:
         """
         if self.birthday is None:
             return "No birthday set"
-        return f"{self.name.value}'s birthday is on {self.birthday.value.strftime('%d.%m.%Y')}"
+        return f"{self.name.value}'s birthday is on {self.birthday.formatted}"
 
 #------------------------------------------------------------------
 
@@ -222,6 +360,7 @@ class Record:
 
                 # Update the contact's name in the Record
                 self.name = Name(new_value)
+                self._touch()
 
                 # Add the contact back to the AddressBook with the new name
                 address_book.add_record(self)
@@ -259,18 +398,106 @@ class Record:
                 return f"Address updated to '{new_value}'."
             else:
                 self.address = None
+                self._touch()
                 return "Address removed."
 
         elif field == 'birthday':
             if new_value:
                 self.birthday = Birthday(new_value)
+                self._touch()
                 return f"Birthday updated to '{new_value}'."
             else:
                 self.birthday = None
+                self._touch()
                 return "Birthday removed."
 
         return "Unknown action."
 
+#------------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """
+        Converts the contact record to a dict of plain, serializable values.
+
+        Returns:
+        - dict: The contact's name, phones, emails, address and birthday (as a date ordinal).
+        """
+        # An ordinal round-trips every date, while strftime("%Y") drops the zero
+        # padding of years below 1000 and the string could not be parsed back
+        return {
+            "name": self.name.value,
+            "phones": [phone.value for phone in self.phones],
+            "emails": [email.address for email in getattr(self, 'emails', [])],
+            "address": self.get_address(),
+            "birthday": self.birthday.value.toordinal() if self.birthday else None,
+        }
+
+#------------------------------------------------------------------
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        """
+        Creates a contact record from a dict produced by `to_dict`.
+
+        The values were validated when they were first added, so the fields are
+        restored without running the validation again.
+
+        Args:
+        - data (dict): The plain contact values.
+
+        Returns:
+        - Record: The restored contact record.
+        """
+        record = cls(data["name"])
+        record.phones = [Phone._restore(phone) for phone in data["phones"]]
+        record.emails = [Email._restore(email) for email in data["emails"]]
+        if data["address"] is not None:
+            record.address = Address._restore(data["address"])
+        if data["birthday"] is not None:
+            record.birthday = Birthday._restore(data["birthday"])
+        return record
+
+#------------------------------------------------------------------
+
+    def __getstate__(self) -> dict:
+        """
+        Returns the attributes of the contact record for pickling.
+
+        Returns:
+        - dict: The contact's fields and version, without the cached joined strings.
+        """
+        return {
+            "name": self.name,
+            "phones": self.phones,
+            "emails": self.emails,
+            "birthday": self.birthday,
+            "address": self.address,
+            "_version": self._version,
+        }
+
+#------------------------------------------------------------------
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restores a pickled contact record.
+
+        Fields missing from records pickled by older versions are set to their
+        defaults.
+
+        Args:
+        - state (dict): The pickled attributes, from `__getstate__` or from the
+        `__dict__` of a record pickled before slots were added.
+        """
+        self.phones = []
+        self.emails = []
+        self.birthday = None
+        self.address = None
+        self._version = 0
+        self._joined = {}
+        for name, value in state.items():
+            if name != "_joined":
+                setattr(self, name, value)
+
 #------------------------------------------------------------------
 
     def __str__(self) -> str:
@@ -280,19 +507,19 @@ class Record:
         Returns:
         - str: A string describing the contact's name and phone numbers.
         """
-        phones_str = '; '.join(str(p) for p in self.phones)
+        phones_str = '; '.join([p.value for p in self.phones])
         if not phones_str:
             phones_str = "----------"
 
         if hasattr(self, 'emails'):
-            emails_str = '; '.join(e.address for e in self.emails)
+            emails_str = '; '.join([e.address for e in self.emails])
         else:
             emails_str = "----------"
 
         address_str = self.get_address() or "----------"
 
         if self.birthday:
-            birthday_str = self.birthday.value.strftime("%d.%m.%Y")
+            birthday_str = self.birthday.formatted
         else:
             birthday_str = "----------"
 
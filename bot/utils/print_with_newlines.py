@@ -23,6 +23,24 @@ Example:
 
 from rich import print as rich_print
 
+# Padding strings for the usual line counts, so they are not rebuilt on every call
+_PADDING = {count: "\n" * count for count in range(4)}
+
+def _padding(count: int) -> str:
+    """
+    Returns a string of the given number of newlines.
+
+    Parameters:
+    - count (int): The number of newlines.
+
+    Returns:
+    str: The newlines, taken from `_PADDING` when possible.
+    """
+    padding = _PADDING.get(count)
+    if padding is None:
+        padding = "\n" * count
+    return padding
+
 def print_with_newlines(
     content: str,
     lines_before: int = 1,
@@ -51,7 +69,10 @@ def print_with_newlines(
         Hello, World!
         (empty line)
     """
-    output = "\n" * lines_before + content + "\n" * lines_after
+    if lines_before == 1 and lines_after == 1:
+        output = f"\n{content}\n"
+    else:
+        output = f"{_padding(lines_before)}{content}{_padding(lines_after)}"
     if use_rich_print:
         rich_print(output)
     else: